@@ -37,6 +37,36 @@ def get_loaded_config() -> Optional[Dict[str, Any]]:
     """获取已加载的MCP配置数据"""
     return _LOADED_CONFIG
 
+def get_env_var(name: str, default: str | None = None) -> str | None:
+    """从 mcp.json 的 env 或 loaded_config 中读取变量，不再依赖 shell export。
+    优先级：loaded_config.env -> loaded_config.environment.env/variables -> loaded_config.mcpServers.*.env -> os.environ
+    """
+    try:
+        cfg = get_loaded_config()
+        if isinstance(cfg, dict):
+            # 顶层 env
+            env = cfg.get('env')
+            if isinstance(env, dict) and name in env:
+                return str(env[name])
+            # environment 下的 env/variables
+            environment = cfg.get('environment')
+            if isinstance(environment, dict):
+                env2 = environment.get('env') or environment.get('variables')
+                if isinstance(env2, dict) and name in env2:
+                    return str(env2[name])
+            # mcpServers.*.env
+            ms = cfg.get('mcpServers')
+            if isinstance(ms, dict):
+                for srv in ms.values():
+                    if isinstance(srv, dict):
+                        env3 = srv.get('env')
+                        if isinstance(env3, dict) and name in env3:
+                            return str(env3[name])
+        # 回退环境变量
+        return os.environ.get(name, default)
+    except Exception:
+        return os.environ.get(name, default)
+
 @mcp_tool(
     name="get_environment_config",
     description="获取当前MCP服务器的环境配置"
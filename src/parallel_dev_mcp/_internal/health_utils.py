@@ -6,7 +6,7 @@ Health Utils - 健康检查工具函数
 """
 
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 def calculate_session_health_score(session_dict: Dict[str, Any]) -> float:
@@ -22,21 +22,47 @@ def calculate_session_health_score(session_dict: Dict[str, Any]) -> float:
     Returns:
         健康分数 (0.0 - 1.0)
     """
+    try:
+        last_activity = datetime.fromisoformat(session_dict.get("last_activity", ""))
+    except (TypeError, ValueError):
+        last_activity = None
+    return _activity_health_score(last_activity, session_dict.get("message_count", 0))
+
+
+def calculate_session_info_health_score(session_info: Any,
+                                        now: Optional[datetime] = None) -> float:
+    """
+    直接基于 SessionInfo 对象计算健康分数
+
+    与 calculate_session_health_score 算法一致，但直接读取属性，
+    省去 to_dict() 的字典构建与 last_activity 的ISO字符串往返解析。
+
+    Args:
+        session_info: SessionInfo 对象（需有 last_activity、message_count 属性）
+        now: 评估基准时间（批量计算时由调用方传入同一时刻，默认当前时间）
+
+    Returns:
+        健康分数 (0.0 - 1.0)
+    """
+    return _activity_health_score(session_info.last_activity, session_info.message_count, now)
+
+
+def _activity_health_score(last_activity: Optional[datetime], message_count: int,
+                           now: Optional[datetime] = None) -> float:
+    """健康分数核心算法：按最近活动时间与消息数量扣分"""
     score = 1.0
     
     # 检查活动时间
     try:
-        last_activity = datetime.fromisoformat(session_dict.get("last_activity", ""))
-        hours_since_activity = (datetime.now() - last_activity).total_seconds() / 3600
+        hours_since_activity = ((now or datetime.now()) - last_activity).total_seconds() / 3600
         if hours_since_activity > 24:
             score -= 0.3
         elif hours_since_activity > 6:
             score -= 0.1
-    except:
+    except TypeError:
         score -= 0.2
     
     # 检查消息数量
-    message_count = session_dict.get("message_count", 0)
     if message_count == 0:
         score -= 0.1
     
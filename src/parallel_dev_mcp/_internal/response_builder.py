@@ -5,9 +5,26 @@ Response Builder - 响应格式标准化服务
 替代项目中15+处重复的响应格式构建逻辑。
 """
 
+import time
 from typing import Any, Dict, Optional, List
 from datetime import datetime
 
+# 状态时间戳缓存：(生成时刻(epoch秒), ISO字符串)，50ms内复用同一字符串；
+# 以不可变元组整体替换，并发读取时总能拿到同一分桶的一对值
+_TIMESTAMP_CACHE_TTL = 0.05
+_timestamp_cache = (0.0, "")
+
+
+def _cached_timestamp() -> str:
+    """返回按50ms分桶缓存的ISO时间戳（仅用于信息性状态字段）"""
+    global _timestamp_cache
+    now = time.time()
+    cached_at, timestamp = _timestamp_cache
+    if now - cached_at > _TIMESTAMP_CACHE_TTL:
+        timestamp = datetime.fromtimestamp(now).isoformat()
+        _timestamp_cache = (now, timestamp)
+    return timestamp
+
 
 class ResponseBuilder:
     """响应构建器 - 标准化所有MCP工具的响应格式"""
@@ -144,19 +161,22 @@ class ResponseBuilder:
         Returns:
             Dict[str, Any]: 操作结果响应
         """
+        # 单次构建结果字典，避免经由success()/error()重复展开kwargs
         if success:
-            result = ResponseBuilder.success(
-                operation=operation,
-                message=message or f"{operation} completed successfully",
-                **kwargs
-            )
+            result = {
+                "success": True,
+                "operation": operation,
+                "message": message or f"{operation} completed successfully"
+            }
         else:
-            result = ResponseBuilder.error(
-                message or f"{operation} failed",
-                operation=operation,
-                **kwargs
-            )
-        
+            result = {
+                "success": False,
+                "error": message or f"{operation} failed",
+                "operation": operation
+            }
+
+        if kwargs:
+            result.update(kwargs)
         return result
     
     @staticmethod
@@ -203,7 +223,7 @@ class ResponseBuilder:
         """
         result = ResponseBuilder.success(
             status=status,
-            timestamp=datetime.now().isoformat(),
+            timestamp=_cached_timestamp(),
             **kwargs
         )
         
@@ -46,6 +46,8 @@ class SessionRegistry:
         self.active_sessions: Dict[str, SessionInfo] = {}
         self.session_relationships: Dict[str, List[str]] = {}
         self.session_messages: Dict[str, List[Dict[str, Any]]] = {}
+        # 所有会话的消息总数（随增删增量维护，避免统计时遍历全部消息列表）
+        self.total_messages = 0
         self.last_cleanup = datetime.now()
     
     def register_session(self, name: str, session_type: str = "unknown", 
@@ -56,6 +58,7 @@ class SessionRegistry:
             return False
         
         self.active_sessions[name] = SessionInfo(name, session_type, project_id, task_id, web_port)
+        self.total_messages -= len(self.session_messages.get(name, ()))
         self.session_messages[name] = []
         return True
     
@@ -95,7 +98,7 @@ class SessionRegistry:
             del self.active_sessions[session_name]
             
         if session_name in self.session_messages:
-            del self.session_messages[session_name]
+            self.total_messages -= len(self.session_messages.pop(session_name))
             
         # 移除会话关系
         if session_name in self.session_relationships:
@@ -119,6 +122,7 @@ class SessionRegistry:
             self.session_messages[session_name] = []
         
         self.session_messages[session_name].append(message)
+        self.total_messages += 1
         
         if session_name in self.active_sessions:
             self.active_sessions[session_name].message_count += 1
@@ -143,12 +147,10 @@ class SessionRegistry:
     
     def get_registry_stats(self) -> Dict[str, Any]:
         """获取注册中心统计信息"""
-        total_messages = sum(len(messages) for messages in self.session_messages.values())
-        
         return {
             "total_sessions": len(self.active_sessions),
             "total_relationships": len(self.session_relationships),
-            "total_messages": total_messages,
+            "total_messages": self.total_messages,
             "last_cleanup": self.last_cleanup.isoformat(),
             "session_types": self._get_session_type_stats()
         }
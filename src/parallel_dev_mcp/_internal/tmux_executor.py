@@ -8,7 +8,10 @@ import subprocess
 import os
 from typing import Dict, Any, List
 from .response_builder import ResponseBuilder
-from .tmux_send_gateway import send_to_tmux, get_tmux_gateway
+from .tmux_send_gateway import SendMode, get_tmux_gateway
+
+# 直接持有网关实例，跳过send_to_tmux的字符串模式解析
+_gateway = get_tmux_gateway()
 
 
 class TmuxExecutor:
@@ -27,12 +30,32 @@ class TmuxExecutor:
         try:
             result = subprocess.run(
                 ['tmux', 'has-session', '-t', session_name],
-                capture_output=True, text=True
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
             )
             return result.returncode == 0
-        except Exception:
+        except OSError:
             return False
-    
+
+    @staticmethod
+    def session_exists_many(session_names: List[str]) -> Dict[str, bool]:
+        """批量检查tmux会话是否存在
+
+        仅执行一次 list-sessions，再在内存中做集合判断，
+        替代逐个调用 has-session。
+
+        Args:
+            session_names: 会话名称列表
+
+        Returns:
+            Dict[str, bool]: 会话名称 -> 是否存在
+        """
+        listed = TmuxExecutor.list_sessions()
+        if not listed.get("success"):
+            return {name: False for name in session_names}
+
+        existing = set(listed["items"])
+        return {name: name in existing for name in session_names}
+
     @staticmethod
     def send_command(session_name: str, command: str) -> Dict[str, Any]:
         """向tmux会话发送命令（收口版 - 通过统一网关）
@@ -52,7 +75,7 @@ class TmuxExecutor:
             Dict[str, Any]: 执行结果
         """
         # 🎯 通过统一网关进行发送（唯一收口）
-        result = send_to_tmux(session_name, command, "command")
+        result = _gateway.send(session_name, command, SendMode.COMMAND)
 
         # 保持原有的返回格式兼容性
         if result.success:
@@ -86,7 +109,7 @@ class TmuxExecutor:
             Dict[str, Any]: 执行结果
         """
         # 🎯 通过统一网关发送原始输入
-        result = send_to_tmux(session_name, input_text, "text")
+        result = _gateway.send(session_name, input_text, SendMode.TEXT)
 
         return {
             "success": result.success,
@@ -139,7 +162,7 @@ class TmuxExecutor:
                 for key, value in environment.items():
                     cmd.extend(['-e', f'{key}={value}'])
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
             
             if result.returncode == 0:
                 return ResponseBuilder.success(
@@ -150,8 +173,8 @@ class TmuxExecutor:
             else:
                 return ResponseBuilder.error(f"Failed to create session: {result.stderr}")
                 
-        except Exception as e:
-            return ResponseBuilder.error(f"Exception creating session: {str(e)}")
+        except OSError as e:
+            return ResponseBuilder.error(f"Exception creating session: {e}")
     
     @staticmethod
     def kill_session(session_name: str) -> Dict[str, Any]:
@@ -166,7 +189,7 @@ class TmuxExecutor:
         try:
             result = subprocess.run(
                 ['tmux', 'kill-session', '-t', session_name],
-                capture_output=True, text=True
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
             )
             
             if result.returncode == 0:
@@ -177,8 +200,8 @@ class TmuxExecutor:
             else:
                 return ResponseBuilder.error(f"Failed to kill session: {result.stderr}")
                 
-        except Exception as e:
-            return ResponseBuilder.error(f"Exception killing session: {str(e)}")
+        except OSError as e:
+            return ResponseBuilder.error(f"Exception killing session: {e}")
     
     @staticmethod
     def list_sessions() -> Dict[str, Any]:
@@ -188,20 +211,22 @@ class TmuxExecutor:
             Dict[str, Any]: 会话列表结果
         """
         try:
-            result = subprocess.run(
+            # 逐行读取字节输出，避免一次性缓冲全部stdout；按行以replace解码，非UTF-8会话名不会抛出UnicodeDecodeError
+            with subprocess.Popen(
                 ['tmux', 'list-sessions', '-F', '#{session_name}'],
-                capture_output=True, text=True
-            )
-            
-            if result.returncode == 0:
-                sessions = result.stdout.strip().split('\n') if result.stdout.strip() else []
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            ) as proc:
+                sessions = [line.rstrip(b'\n').decode('utf-8', 'replace')
+                            for line in proc.stdout if line.strip()]
+
+            if proc.returncode == 0:
                 return ResponseBuilder.list_result(sessions, total_count=len(sessions))
             else:
                 # tmux没有会话时也会返回非0，这是正常情况
                 return ResponseBuilder.list_result([])
                 
-        except Exception as e:
-            return ResponseBuilder.error(f"Exception listing sessions: {str(e)}")
+        except OSError as e:
+            return ResponseBuilder.error(f"Exception listing sessions: {e}")
     
     @staticmethod
     def get_session_info(session_name: str) -> Dict[str, Any]:
@@ -235,8 +260,8 @@ class TmuxExecutor:
                     exists=False
                 )
                 
-        except Exception as e:
-            return ResponseBuilder.error(f"Exception getting session info: {str(e)}")
+        except OSError as e:
+            return ResponseBuilder.error(f"Exception getting session info: {e}")
     
     @staticmethod
     def is_available() -> bool:
@@ -247,7 +272,7 @@ class TmuxExecutor:
         Returns:
             bool: tmux是否可用
         """
-        return get_tmux_gateway().is_tmux_available()
+        return _gateway.is_tmux_available()
 
     @staticmethod
     def send_message_to_session(session_name: str, message: str) -> Dict[str, Any]:
@@ -262,7 +287,7 @@ class TmuxExecutor:
         Returns:
             Dict[str, Any]: 发送结果
         """
-        result = send_to_tmux(session_name, message, "raw")
+        result = _gateway.send(session_name, message, SendMode.RAW)
         return {
             "success": result.success,
             "session_name": session_name,
@@ -302,7 +327,7 @@ class TmuxExecutor:
         Returns:
             Dict[str, Any]: 发送结果
         """
-        result = send_to_tmux(session_name, ctrl_key, "control")
+        result = _gateway.send(session_name, ctrl_key, SendMode.CONTROL)
         return {
             "success": result.success,
             "session_name": session_name,
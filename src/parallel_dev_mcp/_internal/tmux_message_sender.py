@@ -16,26 +16,83 @@ import os
 import logging
 import uuid
 import time
-from collections import deque
+import threading
+import queue
+from array import array
+from concurrent.futures import Future
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from .response_builder import ResponseBuilder
-from .tmux_send_gateway import send_to_tmux, broadcast_to_tmux, get_tmux_gateway
+from .tmux_send_gateway import send_to_tmux, get_tmux_gateway
 
 logger = logging.getLogger(__name__)
 
+# 项目根目录与会话绑定文件路径（导入时计算一次）
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))
+)))
+_BINDING_FILE = os.path.join(_PROJECT_ROOT, '.state', 'session_binding.txt')
+
+# 高频拒绝路径的固定形状响应模板（仅 copy 后填充可变字段，免去 ResponseBuilder 的 kwargs 展开）
+_SESSION_MISMATCH_TEMPLATE = {
+    "success": False,
+    "error": "",
+    "action": "skipped",
+    "method": "session_binding_validation",
+}
+_NOTHING_TO_UNBIND_TEMPLATE = {
+    "success": False,
+    "error": "没有可解绑的会话ID",
+    "operation": "unbind_session",
+}
+_RATE_LIMIT_TEMPLATE = {
+    "success": False,
+    "error": "",
+    "action": "skipped_due_to_limit",
+    "limit_triggered": True,
+}
+
+
+def _preview(text: str, limit: int, suffix: str = "") -> str:
+    """生成消息预览：未超长时直接返回原字符串对象，不做切片拷贝"""
+    if len(text) <= limit:
+        return text
+    return text[:limit] + suffix
+
 
 class TmuxMessageSender:
     """统一的tmux消息发送器 - 解决引号、echo和回车分离问题，支持会话绑定"""
 
+    # 实例仅作兼容转发，不持有任何属性
+    __slots__ = ()
+
     # 类变量用于管理全局状态
     _current_session_id = None
     _session_binding_active = False
-    _binding_file = None
+    _binding_file = _BINDING_FILE
+    # 绑定文件缓存：按 st_mtime_ns 判定是否需要重读，且最多每秒 stat 一次
+    _binding_recheck_seconds = 1.0
+    _binding_mtime_ns = -1
+    _binding_checked_at = 0.0
+    # 绑定状态在多个线程间共享（健康上报、定时继续等），读写需串行
+    _binding_lock = threading.Lock()
+    # 绑定目录只需在首次保存时创建一次
+    _binding_dir_ready = False
     # 事件频率跟踪（参考 examples/hooks/tmux_web_service.py 的 hi 发送逻辑）
     _freq_window_seconds = 30
     _freq_threshold = 1
-    _session_end_calls = deque()
+    # 固定容量环形缓冲（单调时钟时间戳），容量须为2的幂以便按位取模
+    _FREQ_RING_SIZE = 256
+    _freq_ring = array('d', [0.0] * _FREQ_RING_SIZE)
+    _freq_head = 0
+    _freq_tail = 0
+    _freq_len = 0
+    # 合并发送队列（enqueue_message_raw）：同一会话的连续消息在空闲窗口内合并为一次发送
+    _coalesce_window_seconds = 0.008
+    _coalesce_max_batch = 64
+    _send_queue = queue.Queue()
+    _send_worker = None
+    _send_worker_lock = threading.Lock()
 
     @classmethod
     def _get_binding_file_path(cls) -> str:
@@ -43,66 +100,128 @@ class TmuxMessageSender:
 
         存放在项目根目录下的隐藏状态目录：`.state/session_binding.txt`
         """
-        if cls._binding_file is None:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-            cls._binding_file = os.path.join(project_root, '.state', 'session_binding.txt')
         return cls._binding_file
 
     @classmethod
-    def _load_session_binding(cls) -> None:
-        """从文件加载会话绑定状态"""
-        try:
-            binding_file = cls._get_binding_file_path()
-            if os.path.exists(binding_file) and os.path.getsize(binding_file) > 0:
-                with open(binding_file, 'r') as f:
-                    content = f.read().strip()
-                    if content:
-                        cls._current_session_id = content
-                        cls._session_binding_active = True
-                        logger.info(f"加载会话绑定: {cls._current_session_id[:8]}...")
-                    else:
-                        cls._current_session_id = None
-                        cls._session_binding_active = False
-            else:
+    def _load_session_binding(cls, force: bool = False) -> None:
+        """从文件加载会话绑定状态
+
+        绑定几乎不变：距上次检查不足 `_binding_recheck_seconds` 时直接复用内存状态，
+        否则仅 stat 一次，mtime 未变化时跳过 open/read。
+
+        Args:
+            force: 为True时跳过 `_binding_recheck_seconds` 节流，立即检查绑定文件
+        """
+        if not force and time.monotonic() - cls._binding_checked_at < cls._binding_recheck_seconds:
+            return
+
+        with cls._binding_lock:
+            # 等锁期间可能已被其他线程刷新
+            now = time.monotonic()
+            if not force and now - cls._binding_checked_at < cls._binding_recheck_seconds:
+                return
+            cls._binding_checked_at = now
+
+            try:
+                binding_file = cls._get_binding_file_path()
+                try:
+                    st = os.stat(binding_file)
+                except FileNotFoundError:
+                    cls._binding_mtime_ns = -1
+                    cls._current_session_id = None
+                    cls._session_binding_active = False
+                    return
+
+                if st.st_mtime_ns == cls._binding_mtime_ns:
+                    return
+                cls._binding_mtime_ns = st.st_mtime_ns
+
+                content = ""
+                if st.st_size > 0:
+                    with open(binding_file, 'r') as f:
+                        content = f.read().strip()
+                if content:
+                    cls._current_session_id = content
+                    cls._session_binding_active = True
+                    logger.info("加载会话绑定: %s...", content[:8])
+                else:
+                    cls._current_session_id = None
+                    cls._session_binding_active = False
+            except Exception:
+                logger.exception("加载会话绑定失败")
+                cls._binding_mtime_ns = -1
                 cls._current_session_id = None
                 cls._session_binding_active = False
-        except Exception as e:
-            logger.error(f"加载会话绑定失败: {e}")
-            cls._current_session_id = None
-            cls._session_binding_active = False
+
+    @classmethod
+    def _mark_binding_synced(cls, binding_file: str) -> None:
+        """写入绑定文件后同步缓存的mtime，避免下一次加载重读自己刚写的内容"""
+        try:
+            cls._binding_mtime_ns = os.stat(binding_file).st_mtime_ns
+        except OSError:
+            cls._binding_mtime_ns = -1
+        cls._binding_checked_at = time.monotonic()
+
+    @staticmethod
+    def _write_binding_file(binding_file: str, content: str) -> None:
+        """原子写入绑定文件：先写临时文件再 os.replace，读者不会看到截断的空文件"""
+        tmp_file = f"{binding_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, 'w') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, binding_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
+            raise
 
     @classmethod
     def _save_session_binding(cls, session_id: str) -> bool:
         """保存会话绑定到文件"""
-        try:
-            binding_file = cls._get_binding_file_path()
-            os.makedirs(os.path.dirname(binding_file), exist_ok=True)
-            with open(binding_file, 'w') as f:
-                f.write(f"{session_id}\n")
-            cls._current_session_id = session_id
-            cls._session_binding_active = True
-            logger.info(f"保存会话绑定: {session_id[:8]}...")
-            return True
-        except Exception as e:
-            logger.error(f"保存会话绑定失败: {e}")
-            return False
+        with cls._binding_lock:
+            try:
+                binding_file = cls._get_binding_file_path()
+                binding_dir = os.path.dirname(binding_file)
+                if not cls._binding_dir_ready:
+                    os.makedirs(binding_dir, exist_ok=True)
+                    cls._binding_dir_ready = True
+                try:
+                    cls._write_binding_file(binding_file, f"{session_id}\n")
+                except FileNotFoundError:
+                    # 状态目录在进程运行期间被删除：重建目录后重试一次
+                    cls._binding_dir_ready = False
+                    os.makedirs(binding_dir, exist_ok=True)
+                    cls._binding_dir_ready = True
+                    cls._write_binding_file(binding_file, f"{session_id}\n")
+                cls._current_session_id = session_id
+                cls._session_binding_active = True
+                cls._mark_binding_synced(binding_file)
+                logger.info("保存会话绑定: %s...", session_id[:8])
+                return True
+            except Exception:
+                logger.exception("保存会话绑定失败")
+                return False
 
     @classmethod
     def _clear_session_binding(cls) -> bool:
         """清除会话绑定"""
-        try:
-            binding_file = cls._get_binding_file_path()
-            if os.path.exists(binding_file):
-                with open(binding_file, 'w') as f:
-                    f.write("")
-            cls._current_session_id = None
-            cls._session_binding_active = False
-            logger.info("清除会话绑定")
-            return True
-        except Exception as e:
-            logger.error(f"清除会话绑定失败: {e}")
-            return False
+        with cls._binding_lock:
+            try:
+                binding_file = cls._get_binding_file_path()
+                if os.path.exists(binding_file):
+                    cls._write_binding_file(binding_file, "")
+                cls._current_session_id = None
+                cls._session_binding_active = False
+                cls._mark_binding_synced(binding_file)
+                logger.info("清除会话绑定")
+                return True
+            except Exception:
+                logger.exception("清除会话绑定失败")
+                return False
 
     @classmethod
     def bind_session(cls, session_id: str = None, target_session: str = None) -> Dict[str, Any]:
@@ -137,10 +256,7 @@ class TmuxMessageSender:
             session_id = current_session
 
         if not session_id:
-            return ResponseBuilder.error(
-                "没有可解绑的会话ID",
-                operation="unbind_session"
-            )
+            return _NOTHING_TO_UNBIND_TEMPLATE.copy()
 
         # 清除绑定状态
         if cls._clear_session_binding():
@@ -157,15 +273,28 @@ class TmuxMessageSender:
             )
 
     @classmethod
-    def get_current_session_binding(cls) -> str:
-        """获取当前绑定的会话名称（返回字符串，用于web服务）"""
-        cls._load_session_binding()  # 重新加载状态
+    def get_current_session_binding(cls, refresh: bool = False) -> str:
+        """获取当前绑定的会话名称（返回字符串，用于web服务）
+
+        本进程的 bind_session/unbind_session 会同步更新内存状态，轮询路径默认直接读取：
+        已有绑定时不再读取文件，其他进程对绑定文件的修改在 refresh=True 之前都不可见；
+        尚无绑定时最多每 `_binding_recheck_seconds`（1秒）检查一次文件，
+        其他进程新建的绑定最多延迟1秒可见。refresh=True 时跳过节流，立即检查绑定文件。
+        """
+        if refresh or cls._current_session_id is None:
+            cls._load_session_binding(force=refresh)
         return cls._current_session_id
 
     @classmethod
-    def get_current_session_binding_info(cls) -> Dict[str, Any]:
-        """获取当前会话绑定详细状态（返回完整信息）"""
-        cls._load_session_binding()  # 重新加载状态
+    def get_current_session_binding_info(cls, refresh: bool = False) -> Dict[str, Any]:
+        """获取当前会话绑定详细状态（返回完整信息）
+
+        Args:
+            refresh: 为True时跳过节流立即检查绑定文件；默认已有绑定时直接返回内存状态
+                （看不到其他进程的修改），尚无绑定时按1秒节流加载文件
+        """
+        if refresh or cls._current_session_id is None:
+            cls._load_session_binding(force=refresh)
 
         return ResponseBuilder.success(
             operation="get_session_binding",
@@ -179,20 +308,69 @@ class TmuxMessageSender:
     @classmethod
     def _record_session_end_call(cls) -> int:
         """记录一次 SessionEnd 调用，并裁剪时间窗口内的记录，返回窗口内次数"""
-        now = time.time()
-        cls._session_end_calls.append(now)
+        mask = cls._FREQ_RING_SIZE - 1
+        now = time.monotonic()
+        if cls._freq_len == cls._FREQ_RING_SIZE:
+            # 缓冲已满：覆盖最旧记录
+            cls._freq_head = (cls._freq_head + 1) & mask
+            cls._freq_len -= 1
+        cls._freq_ring[cls._freq_tail] = now
+        cls._freq_tail = (cls._freq_tail + 1) & mask
+        cls._freq_len += 1
+
         cutoff = now - cls._freq_window_seconds
-        while cls._session_end_calls and cls._session_end_calls[0] < cutoff:
-            cls._session_end_calls.popleft()
-        return len(cls._session_end_calls)
+        while cls._freq_len and cls._freq_ring[cls._freq_head] < cutoff:
+            cls._freq_head = (cls._freq_head + 1) & mask
+            cls._freq_len -= 1
+        return cls._freq_len
 
     @classmethod
     def _should_trigger_auto_hi(cls) -> bool:
-        return len(cls._session_end_calls) > cls._freq_threshold
+        return cls._freq_len > cls._freq_threshold
 
     @classmethod
     def _reset_frequency_tracker(cls) -> None:
-        cls._session_end_calls.clear()
+        cls._freq_head = cls._freq_tail = cls._freq_len = 0
+
+    @classmethod
+    def _validate_and_resolve_session(cls, session_id: Optional[str], target: str,
+                                      skip_label: str) -> tuple:
+        """会话绑定校验（各发送入口共用）
+
+        Args:
+            session_id: 调用方传入的会话ID
+            target: 目标会话名称（广播时为项目ID），写入跳过响应
+            skip_label: 跳过响应中的动作描述
+
+        Returns:
+            tuple: (生效的会话ID, 不匹配时的跳过响应或None)
+        """
+        cls._load_session_binding()
+        bound_session_id = cls._current_session_id
+
+        # 如果有绑定的session但session_id不匹配，跳过发送
+        if cls._session_binding_active and bound_session_id and session_id and session_id != bound_session_id:
+            skipped = _SESSION_MISMATCH_TEMPLATE.copy()
+            skipped.update(
+                error=f"Session ID 不匹配，跳过{skip_label}",
+                session=target,
+                bound_session_id=bound_session_id,
+                received_session_id=session_id
+            )
+            return None, skipped
+        return session_id or bound_session_id, None
+
+    @staticmethod
+    def _rate_limit_skipped(kind: str, session_name: str, preview_key: str,
+                            preview: str, result) -> Dict[str, Any]:
+        """构建命中限流时的跳过响应（基于固定模板）"""
+        skipped = _RATE_LIMIT_TEMPLATE.copy()
+        skipped["error"] = f"tmux rate limit active; {kind} skipped"
+        skipped["session"] = session_name
+        skipped[preview_key] = preview
+        skipped["limit_reset_time"] = result.limit_reset_time
+        skipped["error_step"] = result.error_step
+        return skipped
 
     @classmethod
     def send_auto_hi(cls, session_name: str) -> Dict[str, Any]:
@@ -216,23 +394,11 @@ class TmuxMessageSender:
             Dict[str, Any]: 发送结果
         """
         try:
-            # 加载当前绑定状态
-            cls._load_session_binding()
-
-            # Session ID 验证逻辑
-            effective_session_id = session_id or cls._current_session_id
-
-            # 如果有绑定的session但session_id不匹配，跳过发送
-            if cls._session_binding_active and cls._current_session_id:
-                if session_id and session_id != cls._current_session_id:
-                    return ResponseBuilder.error(
-                        f"Session ID 不匹配，跳过发送",
-                        session=session_name,
-                        bound_session_id=cls._current_session_id,
-                        received_session_id=session_id,
-                        action="skipped",
-                        method="session_binding_validation"
-                    )
+            effective_session_id, skipped = cls._validate_and_resolve_session(
+                session_id, session_name, "发送"
+            )
+            if skipped:
+                return skipped
 
             # 🎯 通过统一网关发送（唯一的send-keys执行点）
             result = send_to_tmux(session_name, message, "raw")
@@ -242,7 +408,7 @@ class TmuxMessageSender:
                     operation="send_message_raw",
                     session_name=session_name,
                     message_length=len(message),
-                    message_preview=message[:100] + "..." if len(message) > 100 else message,
+                    message_preview=_preview(message, 100, "..."),
                     method="gateway_two_step_send",
                     steps_completed=result.steps_completed,
                     gateway_mode=result.mode.value,
@@ -251,20 +417,14 @@ class TmuxMessageSender:
                 )
             else:
                 # 命中限流：直接返回可机读的限流信息
-                if getattr(result, "limit_triggered", None):
-                    return ResponseBuilder.error(
-                        "tmux rate limit active; message skipped",
-                        session=session_name,
-                        message_preview=message[:50],
-                        action="skipped_due_to_limit",
-                        limit_triggered=True,
-                        limit_reset_time=getattr(result, "limit_reset_time", None),
-                        error_step=result.error_step,
+                if result.limit_triggered:
+                    return cls._rate_limit_skipped(
+                        "message", session_name, "message_preview", _preview(message, 50), result
                     )
                 return ResponseBuilder.error(
                     f"网关发送失败: {result.error}",
                     session=session_name,
-                    message_preview=message[:50],
+                    message_preview=_preview(message, 50),
                     error_step=result.error_step,
                     gateway_error=result.error,
                     session_id=effective_session_id
@@ -275,13 +435,22 @@ class TmuxMessageSender:
                 f"发送消息异常: {str(e)}",
                 session=session_name,
                 exception_type=type(e).__name__,
-                session_id=effective_session_id
+                session_id=session_id
             )
 
+    # 发送消息并自动换行 - send_message_raw的别名（直接复用同一classmethod，省去一层转发调用）
+    send_message_with_newline = send_message_raw
+
+    # === 合并发送队列 ===
+
     @classmethod
-    def send_message_with_newline(cls, session_name: str, message: str, session_id: str = None) -> Dict[str, Any]:
+    def enqueue_message_raw(cls, session_name: str, message: str, session_id: str = None) -> Future:
         """
-        发送消息并自动换行 - send_message_raw的别名方法
+        排队发送原始消息 - 连续发往同一会话的消息合并为一次网关发送
+
+        后台工作线程在 `_coalesce_window_seconds` 内未收到新消息、目标会话/会话ID变化
+        或累积达到 `_coalesce_max_batch` 条时，将已排队内容以换行拼接后经
+        send_message_raw 一次发出。适合流式输出等连续小消息场景。
 
         Args:
             session_name: 目标会话名称
@@ -289,9 +458,75 @@ class TmuxMessageSender:
             session_id: 可选的会话ID
 
         Returns:
-            Dict[str, Any]: 发送结果
+            Future: 结果为与 send_message_raw 相同结构的字典（附带 coalesced_messages）；
+                不关心结果的调用方可直接忽略
         """
-        return cls.send_message_raw(session_name, message, session_id)
+        future = Future()
+        cls._ensure_send_worker()
+        cls._send_queue.put((session_name, message, session_id, future))
+        return future
+
+    @classmethod
+    def _ensure_send_worker(cls) -> None:
+        """按需启动合并发送工作线程"""
+        if cls._send_worker is not None:
+            return
+        with cls._send_worker_lock:
+            if cls._send_worker is None:
+                worker = threading.Thread(
+                    target=cls._send_worker_loop, name="tmux-send-coalescer", daemon=True
+                )
+                worker.start()
+                cls._send_worker = worker
+
+    @classmethod
+    def _send_worker_loop(cls) -> None:
+        """合并发送工作线程主循环（单批异常不会终止线程）"""
+        pending = []
+        while True:
+            try:
+                try:
+                    if pending:
+                        item = cls._send_queue.get(timeout=cls._coalesce_window_seconds)
+                    else:
+                        item = cls._send_queue.get()
+                except queue.Empty:
+                    batch, pending = pending, []
+                    cls._flush_coalesced(batch)
+                    continue
+
+                # 目标会话或会话ID变化时先发出已累积的内容
+                if pending and (item[0] != pending[0][0] or item[2] != pending[0][2]):
+                    batch, pending = pending, []
+                    cls._flush_coalesced(batch)
+                pending.append(item)
+                if len(pending) >= cls._coalesce_max_batch:
+                    batch, pending = pending, []
+                    cls._flush_coalesced(batch)
+            except Exception:
+                logger.exception("合并发送工作线程处理批次失败")
+
+    @classmethod
+    def _flush_coalesced(cls, pending: List[tuple]) -> None:
+        """将累积的同会话消息合并为一次发送，并回填所有Future
+
+        已被调用方取消的Future对应的消息不再发送。
+        """
+        pending = [item for item in pending if item[3].set_running_or_notify_cancel()]
+        if not pending:
+            return
+        session_name, _, session_id, _ = pending[0]
+        merged = "\n".join(item[1] for item in pending)
+        try:
+            result = cls.send_message_raw(session_name, merged, session_id)
+        except Exception as e:
+            result = ResponseBuilder.error(
+                f"合并发送异常: {str(e)}",
+                session=session_name,
+                exception_type=type(e).__name__
+            )
+        for item in pending:
+            item[3].set_result(dict(result, coalesced_messages=len(pending)))
 
     @classmethod
     def send_command_input(cls, session_name: str, command: str, session_id: str = None) -> Dict[str, Any]:
@@ -309,23 +544,11 @@ class TmuxMessageSender:
             Dict[str, Any]: 发送结果
         """
         try:
-            # 加载当前绑定状态
-            cls._load_session_binding()
-
-            # Session ID 验证逻辑
-            effective_session_id = session_id or cls._current_session_id
-
-            # 如果有绑定的session但session_id不匹配，跳过发送
-            if cls._session_binding_active and cls._current_session_id:
-                if session_id and session_id != cls._current_session_id:
-                    return ResponseBuilder.error(
-                        f"Session ID 不匹配，跳过命令发送",
-                        session=session_name,
-                        bound_session_id=cls._current_session_id,
-                        received_session_id=session_id,
-                        action="skipped",
-                        method="session_binding_validation"
-                    )
+            effective_session_id, skipped = cls._validate_and_resolve_session(
+                session_id, session_name, "命令发送"
+            )
+            if skipped:
+                return skipped
 
             # 🎯 通过统一网关发送命令
             result = send_to_tmux(session_name, command, "command")
@@ -343,20 +566,14 @@ class TmuxMessageSender:
                     session_binding_active=cls._session_binding_active
                 )
             else:
-                if getattr(result, "limit_triggered", None):
-                    return ResponseBuilder.error(
-                        "tmux rate limit active; command skipped",
-                        session=session_name,
-                        command_preview=command[:50],
-                        action="skipped_due_to_limit",
-                        limit_triggered=True,
-                        limit_reset_time=getattr(result, "limit_reset_time", None),
-                        error_step=result.error_step,
+                if result.limit_triggered:
+                    return cls._rate_limit_skipped(
+                        "command", session_name, "command_preview", _preview(command, 50), result
                     )
                 return ResponseBuilder.error(
                     f"网关命令发送失败: {result.error}",
                     session=session_name,
-                    command_preview=command[:50],
+                    command_preview=_preview(command, 50),
                     error_step=result.error_step,
                     session_id=effective_session_id
                 )
@@ -366,7 +583,7 @@ class TmuxMessageSender:
                 f"命令发送异常: {str(e)}",
                 session=session_name,
                 exception_type=type(e).__name__,
-                session_id=effective_session_id
+                session_id=session_id
             )
 
     @classmethod
@@ -384,23 +601,11 @@ class TmuxMessageSender:
             Dict[str, Any]: 发送结果
         """
         try:
-            # 加载当前绑定状态
-            cls._load_session_binding()
-
-            # Session ID 验证逻辑
-            effective_session_id = session_id or cls._current_session_id
-
-            # 如果有绑定的session但session_id不匹配，跳过发送
-            if cls._session_binding_active and cls._current_session_id:
-                if session_id and session_id != cls._current_session_id:
-                    return ResponseBuilder.error(
-                        f"Session ID 不匹配，跳过文本发送",
-                        session=session_name,
-                        bound_session_id=cls._current_session_id,
-                        received_session_id=session_id,
-                        action="skipped",
-                        method="session_binding_validation"
-                    )
+            effective_session_id, skipped = cls._validate_and_resolve_session(
+                session_id, session_name, "文本发送"
+            )
+            if skipped:
+                return skipped
 
             # 🎯 通过统一网关发送文本
             result = send_to_tmux(session_name, text, "text")
@@ -418,20 +623,14 @@ class TmuxMessageSender:
                     session_binding_active=cls._session_binding_active
                 )
             else:
-                if getattr(result, "limit_triggered", None):
-                    return ResponseBuilder.error(
-                        "tmux rate limit active; text skipped",
-                        session=session_name,
-                        text_preview=text[:50],
-                        action="skipped_due_to_limit",
-                        limit_triggered=True,
-                        limit_reset_time=getattr(result, "limit_reset_time", None),
-                        error_step=result.error_step,
+                if result.limit_triggered:
+                    return cls._rate_limit_skipped(
+                        "text", session_name, "text_preview", _preview(text, 50), result
                     )
                 return ResponseBuilder.error(
                     f"网关文本发送失败: {result.error}",
                     session=session_name,
-                    text_preview=text[:50],
+                    text_preview=_preview(text, 50),
                     error_step=result.error_step,
                     session_id=effective_session_id
                 )
@@ -441,7 +640,7 @@ class TmuxMessageSender:
                 f"文本发送异常: {str(e)}",
                 session=session_name,
                 exception_type=type(e).__name__,
-                session_id=effective_session_id
+                session_id=session_id
             )
 
     @classmethod
@@ -464,11 +663,11 @@ class TmuxMessageSender:
             Dict[str, Any]: 广播结果统计
         """
         try:
-            # 加载当前绑定状态
-            cls._load_session_binding()
-
-            # Session ID 验证逻辑
-            effective_session_id = session_id or cls._current_session_id
+            effective_session_id, skipped = cls._validate_and_resolve_session(
+                session_id, project_id, "广播"
+            )
+            if skipped:
+                return skipped
 
             target_sessions = cls._find_project_sessions(
                 project_id, include_master, include_children
@@ -482,8 +681,8 @@ class TmuxMessageSender:
                     include_children=include_children
                 )
 
-            # 🎯 通过统一网关进行广播
-            gateway_result = broadcast_to_tmux(target_sessions, message, "raw")
+            # 🎯 通过统一网关进行广播（单次load-buffer，逐会话paste-buffer）
+            gateway_result = get_tmux_gateway().broadcast_via_paste_buffer(target_sessions, message)
 
             return ResponseBuilder.success(
                 operation="broadcast_to_project",
@@ -510,15 +709,18 @@ class TmuxMessageSender:
             )
 
     @classmethod
-    def send_ctrl_key(cls, session_name: str, ctrl_key: str, session_id: str = None) -> Dict[str, Any]:
+    def send_ctrl_key(cls, session_name: str, ctrl_key: str, session_id: str = None,
+                      verbose: bool = False) -> Dict[str, Any]:
         """
         发送控制键（如Ctrl-C, Ctrl-D等）
 
         🔐 GATEWAY: 通过统一网关发送控制键
+        控制键不做会话绑定校验（中断操作须始终可达），session_id 仅为签名兼容保留
 
         Args:
             session_name: 目标会话名称
             ctrl_key: 控制键（如 'C-c', 'C-d', 'C-l'）
+            verbose: 为True时成功响应附带会话、步骤等详细字段
 
         Returns:
             Dict[str, Any]: 发送结果
@@ -528,6 +730,9 @@ class TmuxMessageSender:
             result = send_to_tmux(session_name, ctrl_key, "control")
 
             if result.success:
+                # 控制键对延迟最敏感：默认只返回调用方实际读取的字段
+                if not verbose:
+                    return {"success": True, "ctrl_key": ctrl_key}
                 return ResponseBuilder.success(
                     operation="send_ctrl_key",
                     session_name=session_name,
@@ -560,9 +765,7 @@ class TmuxMessageSender:
 
         🔐 GATEWAY: 使用网关的会话检查功能
         """
-        gateway = get_tmux_gateway()
-        available_sessions = gateway.get_available_sessions()
-        return session_name in available_sessions
+        return get_tmux_gateway().session_exists(session_name)
 
     @classmethod
     def _find_project_sessions(cls, project_id: str, include_master: bool = True,
@@ -572,26 +775,20 @@ class TmuxMessageSender:
         🔐 GATEWAY: 使用网关获取会话列表
         """
         try:
-            gateway = get_tmux_gateway()
-            all_sessions = gateway.get_available_sessions()
+            # 广播常在循环中触发，复用网关的会话名缓存
+            all_sessions = get_tmux_gateway().get_cached_sessions()
 
-            sessions = []
             expected_master = f"parallel_{project_id}_task_master"
             expected_child_prefix = f"parallel_{project_id}_task_child_"
 
-            for session in all_sessions:
-                # 检查主会话
-                if include_master and session == expected_master:
-                    sessions.append(session)
-
-                # 检查子会话
-                if include_children and session.startswith(expected_child_prefix):
-                    sessions.append(session)
-
-            return sessions
+            return sorted(
+                session for session in all_sessions
+                if (include_master and session == expected_master)
+                or (include_children and session.startswith(expected_child_prefix))
+            )
 
         except Exception as e:
-            logger.error(f"查找项目会话时出错: {e}")
+            logger.error("查找项目会话时出错: %s", e)
             return []
 
     @classmethod
@@ -10,18 +10,202 @@ Tmux Send Gateway - 统一的tmux发送收口
 2. 高内聚低耦合 - 所有发送变体都在此文件内统一管理
 3. 错误处理集中 - 统一的异常处理和日志记录
 4. 接口标准化 - 提供标准化的发送接口给其他模块
+
+性能取舍：Linux 上发送路径的 tmux 子进程以 close_fds=False 启动，省去子进程逐个关闭
+继承fd的开销。Python 自身创建的fd默认不可继承（PEP 446），不会泄漏给tmux；
+若有代码显式调用 os.set_inheritable(fd, True)，该fd会被tmux子进程继承。
 """
 
+import asyncio
+import functools
+import os
+import shutil
 import subprocess
+import sys
 import logging
 import re
+import select
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Union, Tuple
+from typing import Dict, Any, List, Optional, Sequence, Union, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# 网关初始化日志只输出一次
+_gateway_init_logged = False
+
+# 发送路径子进程是否关闭继承的fd（见模块文档中的性能取舍）
+_CLOSE_FDS = sys.platform != 'linux'
+
+
+def _escape_trailing_semicolon(arg: str) -> str:
+    """tmux 将以 ';' 结尾的命令行参数视为命令分隔符，需转义为 '\\;' 才能原样发送"""
+    if arg.endswith(';'):
+        return arg[:-1] + '\\;'
+    return arg
+
+
+# send_many 单次tmux调用最多串联的条目数（控制argv长度）
+_SEND_MANY_CHUNK_SIZE = 100
+
+
+# 广播共享线程池：逐会话的子进程调用（限流检查、粘贴发送）互不依赖，可并行等待
+_BROADCAST_MAX_WORKERS = 16
+_broadcast_executor: Optional[ThreadPoolExecutor] = None
+_broadcast_executor_lock = threading.Lock()
+
+
+def _get_broadcast_executor() -> ThreadPoolExecutor:
+    """按需创建广播共享线程池（整个进程复用，避免每次广播构建线程池）"""
+    global _broadcast_executor
+    if _broadcast_executor is None:
+        with _broadcast_executor_lock:
+            if _broadcast_executor is None:
+                _broadcast_executor = ThreadPoolExecutor(
+                    max_workers=_BROADCAST_MAX_WORKERS, thread_name_prefix="tmux-broadcast"
+                )
+    return _broadcast_executor
+
+
+def _map_sessions(func, session_names: List[str]) -> list:
+    """对每个会话执行func并按输入顺序返回结果；多于一个会话时并行执行"""
+    if len(session_names) < 2:
+        return [func(session_name) for session_name in session_names]
+    return list(_get_broadcast_executor().map(func, session_names))
+
+
+# tmux 找不到目标时的错误信息（用于定位串联命令中失败的会话）
+_TMUX_TARGET_ERROR_PATTERN = re.compile(r"can't find (?:session|window|pane): (.+)")
+
+# 无法放入单引号的字符及其在tmux命令语法中的写法
+_TMUX_QUOTE_SPECIAL = {"'": "\"'\"", "\n": '"\\n"', "\r": '"\\r"'}
+
+
+def _tmux_quote(arg: str) -> str:
+    """将参数转为tmux命令语法的字面量（控制模式按行发送命令，需自行引用）
+
+    普通字符放入单引号（不做任何展开）；单引号与换行无法出现在单引号内，
+    分别以 "'" 与 "\\n" 拼接。
+    """
+    parts = []
+    run = []
+    for ch in arg:
+        if ch in _TMUX_QUOTE_SPECIAL:
+            if run:
+                parts.append("'" + "".join(run) + "'")
+                run = []
+            parts.append(_TMUX_QUOTE_SPECIAL[ch])
+        else:
+            run.append(ch)
+    if run or not parts:
+        parts.append("'" + "".join(run) + "'")
+    return "".join(parts)
+
+
+class _ControlModeClient:
+    """tmux 控制模式（tmux -C）长连接
+
+    复用单个客户端进程按行执行命令，省去每次发送的 fork/exec。
+    连接建立或命令写入失败时以 OSError 抛出，由调用方回退到一次性子进程；
+    命令行写入后读取响应失败时tmux可能已执行该命令，按执行失败返回，不得重发。
+    """
+
+    _READY_MARKER = "__parallel_dev_gateway_ready__"
+
+    def __init__(self, timeout: float = 2.0):
+        self._proc = None
+        self._buf = b""
+        self._timeout = timeout
+
+    def run(self, commands: List[List[str]]) -> Tuple[int, str]:
+        """执行一组命令（以 ';' 串联为一行），返回 (返回码, 错误输出)
+
+        Raises:
+            OSError: 连接建立或写入失败（命令尚未送达tmux，可安全回退）
+        """
+        line = " ; ".join(" ".join(_tmux_quote(arg) for arg in cmd) for cmd in commands)
+        try:
+            self._ensure_started()
+            self._proc.stdin.write(line.encode("utf-8") + b"\n")
+        except (OSError, ValueError) as e:
+            self.close()
+            raise OSError(f"tmux control mode failed: {e}") from e
+        try:
+            return self._read_results(len(commands))
+        except (OSError, ValueError) as e:
+            # 命令已写入，send-keys 可能已执行：回退重发会重复投递，按失败返回
+            self.close()
+            return -1, f"tmux control mode response lost: {e}"
+
+    def close(self) -> None:
+        """关闭连接（关闭stdin即可让控制客户端退出）"""
+        proc, self._proc = self._proc, None
+        self._buf = b""
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+
+    def _ensure_started(self) -> None:
+        if self._proc is not None and self._proc.poll() is None:
+            return
+        self._buf = b""
+        # no-output：不接收窗格输出通知，避免未读数据堆积
+        self._proc = subprocess.Popen(
+            ['tmux', '-C', 'attach-session', '-f', 'no-output'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=0
+        )
+        # 以标记命令跳过连接建立时的初始输出块
+        self._proc.stdin.write(f"display-message -p {self._READY_MARKER}\n".encode())
+        while self._readline() != self._READY_MARKER:
+            pass
+        self._read_results(1)
+
+    def _read_results(self, count: int) -> Tuple[int, str]:
+        """读取本客户端发出的 count 个命令的 %begin/%end|%error 输出块"""
+        returncode = 0
+        errors = []
+        body = None
+        while count:
+            line = self._readline()
+            fields = line.split()
+            # 仅处理标志位为1（本客户端发起）的输出块，忽略其他通知
+            own_block = len(fields) == 4 and fields[3] == "1"
+            if fields and fields[0] == "%begin" and own_block:
+                body = []
+            elif fields and fields[0] in ("%end", "%error") and own_block:
+                if fields[0] == "%error":
+                    returncode = 1
+                    errors.extend(body or [])
+                body = None
+                count -= 1
+            elif body is not None:
+                body.append(line)
+        return returncode, "\n".join(errors)
+
+    def _readline(self) -> str:
+        deadline = time.monotonic() + self._timeout
+        fd = self._proc.stdout.fileno()
+        while b"\n" not in self._buf:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise OSError("response timeout")
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if ready:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    raise OSError("connection closed")
+                self._buf += chunk
+        line, _, self._buf = self._buf.partition(b"\n")
+        return line.decode("utf-8", "replace").rstrip("\r")
+
 
 class SendMode(Enum):
     """发送模式枚举"""
@@ -31,14 +215,29 @@ class SendMode(Enum):
     CONTROL = "control"     # 控制键发送
 
 
-@dataclass
+# 失败结果共享的空步骤序列（不可变，可安全复用）
+_EMPTY_STEPS: Tuple[str, ...] = ()
+
+# 空目标列表的广播结果模板（返回前复制并补充 content_length/mode）
+_EMPTY_BROADCAST_RESULT: Dict[str, Any] = {
+    "success": False,
+    "total_sessions": 0,
+    "success_count": 0,
+    "failed_count": 0,
+    "success_rate": 0.0,
+    "failed_sessions": [],
+    "broadcast_results": [],
+}
+
+
+@dataclass(slots=True)
 class SendResult:
     """发送结果数据类"""
     success: bool
     session_name: str
     content: str
     mode: SendMode
-    steps_completed: List[str]
+    steps_completed: Sequence[str]
     error: Optional[str] = None
     error_step: Optional[str] = None
     return_code_1: Optional[int] = None
@@ -56,15 +255,18 @@ class TmuxSendGateway:
     """
 
     # 类级别的全局配置
-    _instance = None
     _debug_mode = False
     _dry_run = False
-
-    def __new__(cls):
-        """单例模式确保全局唯一性"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    # 会话名集合缓存（进程内唯一的会话列表缓存）：由 get_available_sessions 刷新，
+    # 会话校验与广播查找共用；命中集合且未过期即视为存在，未命中时总是重新获取，新建会话不会被误判
+    _session_validate_ttl = 1.0
+    _session_set: frozenset = frozenset()
+    _sessions_cache_ts = 0.0
+    _session_set_lock = threading.Lock()
+    # 控制模式长连接（可选，默认关闭）：send-keys 经由单个 tmux -C 客户端执行
+    _control_mode = False
+    _control_client: Optional[_ControlModeClient] = None
+    _control_lock = threading.Lock()
 
     @classmethod
     def enable_debug(cls, enabled: bool = True):
@@ -78,10 +280,21 @@ class TmuxSendGateway:
         """启用干跑模式（不实际执行，仅记录）"""
         cls._dry_run = enabled
 
+    @classmethod
+    def enable_control_mode(cls, enabled: bool = True):
+        """启用控制模式长连接（连接失败时自动回退到一次性子进程）"""
+        with cls._control_lock:
+            cls._control_mode = enabled
+            if not enabled and cls._control_client is not None:
+                cls._control_client.close()
+                cls._control_client = None
+
     def __init__(self):
-        """初始化网关"""
-        if not hasattr(self, '_initialized'):
-            self._initialized = True
+        """初始化网关（全局实例见模块级 GATEWAY；所有状态均为类级别共享）"""
+        global _gateway_init_logged
+        self._initialized = True
+        if not _gateway_init_logged:
+            _gateway_init_logged = True
             logger.info("🔐 TmuxSendGateway initialized - 统一发送收口已启动")
 
     def send(self, session_name: str, content: str, mode: SendMode = SendMode.RAW) -> SendResult:
@@ -99,56 +312,19 @@ class TmuxSendGateway:
         if self._debug_mode:
             logger.debug(f"🎯 Gateway Send: {session_name} | {mode.value} | {content[:50]}...")
 
-        # 统一的前置检查
-        if not self._validate_session(session_name):
-            return SendResult(
-                success=False,
-                session_name=session_name,
-                content=content,
-                mode=mode,
-                steps_completed=[],
-                error=f"Session does not exist: {session_name}",
-                error_step="session_validation"
-            )
-
-        # 在发送前执行速率限制检查（仅对RAW/COMMAND/TEXT有效，CONTROL跳过）
-        if mode in (SendMode.RAW, SendMode.COMMAND, SendMode.TEXT):
-            limit_hit, reset_iso = self._pre_send_limit_check(session_name)
-            if limit_hit:
-                # 命中限制：不发送，返回带有reset时间的信息
-                return SendResult(
-                    success=False,
-                    session_name=session_name,
-                    content=content,
-                    mode=mode,
-                    steps_completed=["limit_detected"],
-                    error=(
-                        f"5-hour limit reached; will reset at {reset_iso}"
-                        if reset_iso else "5-hour limit reached"
-                    ),
-                    error_step="pre_limit_check",
-                    limit_triggered=True,
-                    limit_reset_time=reset_iso
-                )
+        # 统一的前置检查（会话存在性 + 速率限制）
+        precheck_failure = self._run_pre_send_checks(session_name, content, mode)
+        if precheck_failure is not None:
+            return precheck_failure
 
         # 根据模式分发到具体发送方法
-        if mode == SendMode.RAW:
-            return self._send_raw_content(session_name, content)
-        elif mode == SendMode.COMMAND:
-            return self._send_command_input(session_name, content)
-        elif mode == SendMode.TEXT:
-            return self._send_text_input(session_name, content)
-        elif mode == SendMode.CONTROL:
-            return self._send_control_key(session_name, content)
+        handler = self._DISPATCH.get(mode)
+        if handler is not None:
+            return handler(self, session_name, content, mode)
         else:
-            return SendResult(
-                success=False,
-                session_name=session_name,
-                content=content,
-                mode=mode,
-                steps_completed=[],
-                error=f"Unknown send mode: {mode}",
-                error_step="mode_validation"
+            return self._fail(
+                session_name, content, mode,
+                f"Unknown send mode: {mode}", "mode_validation"
             )
 
     def send_raw(self, session_name: str, content: str) -> SendResult:
@@ -167,27 +343,370 @@ class TmuxSendGateway:
         """发送控制键"""
         return self.send(session_name, key, SendMode.CONTROL)
 
+    def send_many(self, session_name: str, contents: List[str],
+                  mode: SendMode = SendMode.RAW) -> SendResult:
+        """
+        批量发送 - 向同一会话依次发送多条内容，每条后回车
+
+        所有条目以 ';' 串联为一次tmux调用（超过 `_SEND_MANY_CHUNK_SIZE` 条时分块），
+        每条仍遵循两步发送：内容与回车为两条独立的 send-keys 命令。
+        会话校验与限流检查只执行一次。CONTROL 模式下每条按控制键发送、不追加回车。
+
+        Args:
+            session_name: 目标会话名称
+            contents: 按顺序发送的内容列表
+            mode: 发送模式
+
+        Returns:
+            SendResult: 整批的发送结果；content 为以换行连接的全部内容，
+            失败时 steps_completed 记录失败前已完成的步骤
+        """
+        joined = "\n".join(contents)
+        if not contents:
+            return SendResult(
+                success=True, session_name=session_name, content=joined,
+                mode=mode, steps_completed=_EMPTY_STEPS
+            )
+
+        precheck_failure = self._run_pre_send_checks(session_name, joined, mode)
+        if precheck_failure is not None:
+            return precheck_failure
+        if mode not in self._DISPATCH:
+            return self._fail(
+                session_name, joined, mode,
+                f"Unknown send mode: {mode}", "mode_validation"
+            )
+
+        entry_steps = ["control_key"] if mode == SendMode.CONTROL else ["content", "enter"]
+        if self._dry_run:
+            logger.info(f"🔄 DRY RUN - Send Many: {session_name} <- {len(contents)} entries")
+            return SendResult(
+                success=True, session_name=session_name, content=joined, mode=mode,
+                steps_completed=["dry_run_" + step for step in entry_steps] * len(contents)
+            )
+        return self._send_many_chunks(session_name, contents, joined, mode, entry_steps)
+
+    def _send_many_chunks(self, session_name: str, contents: List[str], joined: str,
+                          mode: SendMode, entry_steps: List[str]) -> SendResult:
+        """按 `_SEND_MANY_CHUNK_SIZE` 分块串联发送；任一块失败即停止，记录失败前已完成的步骤"""
+        steps_completed: List[str] = []
+        for start in range(0, len(contents), _SEND_MANY_CHUNK_SIZE):
+            chunk = contents[start:start + _SEND_MANY_CHUNK_SIZE]
+            commands = self._send_many_commands(session_name, chunk, mode)
+            try:
+                outcome = self._run_control_commands(commands)
+                if outcome is None:
+                    outcome = self._run_tmux_chain(commands)
+            except Exception as e:
+                return self._many_result(
+                    session_name, joined, mode, steps_completed,
+                    error=f"Send many exception: {str(e)}", error_step="execution_exception"
+                )
+
+            returncode, stderr = outcome
+            if returncode != 0:
+                self._invalidate_session_cache(stderr)
+                return self._many_result(
+                    session_name, joined, mode, steps_completed,
+                    error=f"Send many failed: {stderr}", error_step="content_send",
+                    return_code_1=returncode
+                )
+            steps_completed.extend(entry_steps * len(chunk))
+
+        return self._many_result(session_name, joined, mode, steps_completed,
+                                 return_code_1=0, return_code_2=0)
+
+    @staticmethod
+    def _send_many_commands(session_name: str, chunk: List[str],
+                            mode: SendMode) -> List[List[str]]:
+        """构建一块条目的tmux命令：CONTROL 每条一个控制键；其他模式每条遵循两步发送
+        （内容 send-keys 与回车 send-keys 分离）"""
+        if mode == SendMode.CONTROL:
+            return [['send-keys', '-t', session_name, key] for key in chunk]
+        commands = []
+        for item in chunk:
+            commands.append(['send-keys', '-t', session_name, '--', item])
+            commands.append(['send-keys', '-t', session_name, 'C-m'])
+        return commands
+
+    @staticmethod
+    def _many_result(session_name: str, joined: str, mode: SendMode,
+                     steps_completed: List[str], error: Optional[str] = None,
+                     **extra) -> SendResult:
+        """构建 send_many 的整批结果（error 为空即成功）"""
+        return SendResult(
+            success=error is None, session_name=session_name, content=joined, mode=mode,
+            steps_completed=steps_completed, error=error, **extra
+        )
+
+    @staticmethod
+    def _run_tmux_chain(commands: List[List[str]]) -> Tuple[int, str]:
+        """以 ';' 串联多条命令，在一次tmux子进程中执行，返回 (返回码, 错误输出)"""
+        argv = ['tmux']
+        for command in commands:
+            if len(argv) > 1:
+                argv.append(';')
+            # 以 ';' 结尾的参数需转义，否则会被tmux当作命令分隔符
+            argv.extend(_escape_trailing_semicolon(arg) for arg in command)
+        result = subprocess.run(
+            argv, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+            close_fds=_CLOSE_FDS
+        )
+        return result.returncode, result.stderr
+
+    def send_lines(self, session_name: str, text: str,
+                   mode: SendMode = SendMode.RAW) -> SendResult:
+        """按换行拆分文本后逐行批量发送（见 send_many）"""
+        return self.send_many(session_name, text.split("\n"), mode)
+
     def broadcast_to_sessions(self, session_names: List[str], content: str,
                              mode: SendMode = SendMode.RAW) -> Dict[str, Any]:
         """
         向多个会话广播内容
 
         Args:
-            session_names: 目标会话名称列表
+            session_names: 目标会话名称列表（重复的会话名按条目逐一发送并计数）
             content: 广播内容
             mode: 发送模式
 
         Returns:
             Dict[str, Any]: 广播结果统计
         """
-        results = []
+        if not session_names:
+            return self._empty_broadcast(content, mode)
+        if self._dry_run or self._control_mode or len(session_names) < 2:
+            # 干跑/控制模式长连接下逐会话发送已足够廉价；先刷新一次会话缓存供逐会话校验复用
+            if not self._dry_run:
+                self.get_available_sessions()
+            results = [self.send(session_name, content, mode) for session_name in session_names]
+        else:
+            results = self._chained_broadcast(session_names, content, mode)
+        return self._summarize_broadcast(session_names, results, content, mode)
+
+    def _chained_broadcast(self, session_names: List[str], content: str,
+                           mode: SendMode) -> List[SendResult]:
+        """以 ';' 串联所有目标的 send-keys，在一次tmux调用中完成广播
+
+        会话校验只执行一次 list-sessions。tmux 在首个失败命令处停止执行后续命令，
+        因此按错误信息定位失败会话：其之前的会话视为成功，之后的会话重新串联发送。
+
+        与逐会话发送路径一致，重复出现的会话名按条目逐一投递（同一会话列出两次即收到两次内容），
+        返回结果与 session_names 一一对应，success_count 按条目计数；前置检查仅对去重后的名称执行一次。
+        """
+        known_sessions = set(self.get_available_sessions())
+        unique_names = list(dict.fromkeys(session_names))
+        failures = dict(zip(unique_names, _map_sessions(
+            lambda session_name: self._run_pre_send_checks(session_name, content, mode, known_sessions),
+            unique_names
+        )))
+        # 以条目下标跟踪发送目标，重复会话名各自对应一个结果
+        results: List[Optional[SendResult]] = [failures[name] for name in session_names]
+        targets = [index for index, result in enumerate(results) if result is None]
+        self._send_chained_rounds(session_names, targets, results, content, mode)
+        return results
+
+    def _send_chained_rounds(self, session_names: List[str], targets: List[int],
+                             results: List[Optional[SendResult]], content: str,
+                             mode: SendMode) -> None:
+        """串联发送 targets（条目下标）并写入 results；失败时从失败会话之后重新串联剩余目标"""
+        steps = ["control_key"] if mode == SendMode.CONTROL else ["content", "enter"]
+        while targets:
+            commands = self._broadcast_commands(
+                [session_names[index] for index in targets], content, mode
+            )
+            try:
+                returncode, stderr = self._run_tmux_chain(commands)
+            except OSError as e:
+                returncode, stderr = -1, str(e)
+
+            if returncode == 0:
+                succeeded, failed, targets = targets, [], []
+            else:
+                self._invalidate_session_cache(stderr)
+                succeeded, failed, targets = self._split_chained_failure(
+                    session_names, targets, stderr
+                )
+
+            for index in succeeded:
+                results[index] = SendResult(
+                    success=True,
+                    session_name=session_names[index],
+                    content=content,
+                    mode=mode,
+                    steps_completed=list(steps),
+                    return_code_1=0,
+                    return_code_2=0
+                )
+            for index in failed:
+                results[index] = self._fail(
+                    session_names[index], content, mode,
+                    f"Chained send failed: {stderr.strip()}", "content_send", return_code_1=returncode
+                )
+
+    @staticmethod
+    def _broadcast_commands(session_names: List[str], content: str,
+                            mode: SendMode) -> List[List[str]]:
+        """构建串联广播的tmux命令：非CONTROL模式每个会话为内容与回车两条 send-keys"""
+        commands = []
+        for session_name in session_names:
+            if mode == SendMode.CONTROL:
+                commands.append(['send-keys', '-t', session_name, content])
+            else:
+                commands.append(['send-keys', '-t', session_name, '--', content])
+                commands.append(['send-keys', '-t', session_name, 'C-m'])
+        return commands
+
+    @staticmethod
+    def _split_chained_failure(session_names: List[str], targets: List[int],
+                               stderr: str) -> Tuple[List[int], List[int], List[int]]:
+        """按tmux的 "can't find session/window/pane" 错误定位失败会话
+
+        tmux 在首个失败命令处停止执行，因此失败会话之前的条目已送达。
+
+        Returns:
+            (已成功, 失败, 待重新串联) 三组条目下标；无法定位失败会话时不重发
+            （避免重复投递），剩余目标全部记为失败
+        """
+        match = _TMUX_TARGET_ERROR_PATTERN.search(stderr)
+        failed_name = match.group(1).strip() if match else None
+        target_names = [session_names[index] for index in targets]
+        if failed_name not in target_names:
+            return [], list(targets), []
+        # 失败会话在本轮中后续重复出现的条目同样记为失败，不再重发
+        position = target_names.index(failed_name)
+        failed = [index for index in targets[position:] if session_names[index] == failed_name]
+        remaining = [index for index in targets[position + 1:]
+                     if session_names[index] != failed_name]
+        return targets[:position], failed, remaining
+
+    async def send_async(self, session_name: str, content: str,
+                         mode: SendMode = SendMode.RAW) -> SendResult:
+        """
+        异步发送 - 在事件循环中等待tmux子进程，不阻塞其他协程
+
+        前置检查（会话校验、限流检查）在线程中执行；控制键、干跑与控制模式长连接
+        复用同步实现（同样放入线程）。
+
+        Args:
+            session_name: 目标会话名称
+            content: 要发送的内容
+            mode: 发送模式
+
+        Returns:
+            SendResult: 与 send() 相同的发送结果
+        """
+        if mode not in (SendMode.RAW, SendMode.COMMAND, SendMode.TEXT) \
+                or self._dry_run or self._control_mode:
+            return await asyncio.to_thread(self.send, session_name, content, mode)
+
+        precheck_failure = await asyncio.to_thread(
+            self._run_pre_send_checks, session_name, content, mode
+        )
+        if precheck_failure is not None:
+            return precheck_failure
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *self._two_step_argv(session_name, content),
+                stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE,
+                close_fds=_CLOSE_FDS
+            )
+            _, stderr = await proc.communicate()
+        except OSError as e:
+            return self._fail(
+                session_name, content, mode,
+                f"Two-step send exception: {str(e)}", "execution_exception"
+            )
+        return self._two_step_result(
+            session_name, content, mode, proc.returncode, stderr.decode('utf-8', 'replace')
+        )
+
+    async def broadcast_async(self, session_names: List[str], content: str,
+                              mode: SendMode = SendMode.RAW) -> Dict[str, Any]:
+        """
+        异步广播 - 各会话的发送并发进行
+
+        Returns:
+            Dict[str, Any]: 广播结果统计（与 broadcast_to_sessions 相同结构）
+        """
+        if not session_names:
+            return self._empty_broadcast(content, mode)
+        results = await asyncio.gather(
+            *(self.send_async(session_name, content, mode) for session_name in session_names)
+        )
+        return self._summarize_broadcast(session_names, list(results), content, mode)
+
+    def broadcast_via_paste_buffer(self, session_names: List[str], content: str) -> Dict[str, Any]:
+        """
+        通过tmux粘贴缓冲区向多个会话广播原始内容
+
+        内容只经 `load-buffer` 写入一次，随后对每个目标执行 `paste-buffer` + 回车，
+        消息大小不再随目标数量重复经过argv。会话校验与限流检查与 send() 保持一致。
+        缓冲区加载失败时回退到逐会话 send-keys。
+
+        Args:
+            session_names: 目标会话名称列表
+            content: 广播内容
+
+        Returns:
+            Dict[str, Any]: 广播结果统计（与 broadcast_to_sessions 相同结构）
+        """
+        if self._dry_run or not session_names:
+            return self.broadcast_to_sessions(session_names, content, SendMode.RAW)
+
+        buffer_name = f"parallel_dev_broadcast_{os.getpid()}_{threading.get_ident()}"
+        if not self._load_paste_buffer(buffer_name, content):
+            return self.broadcast_to_sessions(session_names, content, SendMode.RAW)
+
+        try:
+            results = _map_sessions(
+                lambda session_name: self._paste_buffer_send(session_name, content, buffer_name),
+                session_names
+            )
+        finally:
+            self._delete_paste_buffer(buffer_name)
+
+        return self._summarize_broadcast(session_names, results, content, SendMode.RAW)
+
+    @staticmethod
+    def _load_paste_buffer(buffer_name: str, content: str) -> bool:
+        """经 stdin 将内容写入命名粘贴缓冲区；失败返回False（调用方回退到 send-keys）"""
+        try:
+            loaded = subprocess.run(
+                ['tmux', 'load-buffer', '-b', buffer_name, '-'],
+                input=content.encode('utf-8'), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            return False
+        return loaded.returncode == 0
+
+    @staticmethod
+    def _delete_paste_buffer(buffer_name: str) -> None:
+        """删除广播使用的粘贴缓冲区（失败忽略）"""
+        try:
+            subprocess.run(['tmux', 'delete-buffer', '-b', buffer_name],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _empty_broadcast(content: str, mode: SendMode) -> Dict[str, Any]:
+        """空目标列表的广播结果（不发起任何tmux调用）"""
+        result = dict(_EMPTY_BROADCAST_RESULT, failed_sessions=[], broadcast_results=[])
+        result["content_length"] = len(content)
+        result["mode"] = mode.value
+        return result
+
+    def _summarize_broadcast(self, session_names: List[str], results: List[SendResult],
+                             content: str, mode: SendMode) -> Dict[str, Any]:
+        """汇总广播结果统计"""
+        broadcast_results = []
         success_count = 0
         failed_sessions = []
 
-        for session_name in session_names:
-            result = self.send(session_name, content, mode)
-            results.append({
-                "session": session_name,
+        for result in results:
+            broadcast_results.append({
+                "session": result.session_name,
                 "success": result.success,
                 "error": result.error
             })
@@ -195,36 +714,118 @@ class TmuxSendGateway:
             if result.success:
                 success_count += 1
             else:
-                failed_sessions.append(session_name)
+                failed_sessions.append(result.session_name)
 
+        total = len(session_names)
         return {
             "success": success_count > 0,
-            "total_sessions": len(session_names),
+            "total_sessions": total,
             "success_count": success_count,
             "failed_count": len(failed_sessions),
-            "success_rate": f"{(success_count/len(session_names)*100):.1f}%",
+            "success_rate": success_count / total if total else 0.0,
             "failed_sessions": failed_sessions,
-            "broadcast_results": results,
+            "broadcast_results": broadcast_results,
             "content_length": len(content),
             "mode": mode.value
         }
 
     # === 核心发送实现方法（私有） ===
 
-    def _send_raw_content(self, session_name: str, content: str) -> SendResult:
-        """发送原始内容的核心实现"""
-        return self._execute_two_step_send(session_name, content, SendMode.RAW)
+    def _run_pre_send_checks(self, session_name: str, content: str, mode: SendMode,
+                             known_sessions: Optional[set] = None) -> Optional[SendResult]:
+        """发送前检查：会话存在性与速率限制。通过返回None，否则返回失败结果
+
+        Args:
+            known_sessions: 已批量获取的会话名集合；提供时以集合判断代替 has-session
+        """
+        if known_sessions is not None:
+            exists = session_name in known_sessions
+        else:
+            exists = self.session_exists(session_name)
+        if not exists:
+            return self._fail(
+                session_name, content, mode,
+                f"Session does not exist: {session_name}", "session_validation"
+            )
 
-    def _send_command_input(self, session_name: str, command: str) -> SendResult:
-        """发送命令输入的核心实现"""
-        return self._execute_two_step_send(session_name, command, SendMode.COMMAND)
+        # 在发送前执行速率限制检查（仅对RAW/COMMAND/TEXT有效，CONTROL跳过）
+        if mode in (SendMode.RAW, SendMode.COMMAND, SendMode.TEXT):
+            limit_hit, reset_iso = self._pre_send_limit_check(session_name)
+            if limit_hit:
+                # 命中限制：不发送，返回带有reset时间的信息
+                return SendResult(
+                    success=False,
+                    session_name=session_name,
+                    content=content,
+                    mode=mode,
+                    steps_completed=["limit_detected"],
+                    error=(
+                        f"5-hour limit reached; will reset at {reset_iso}"
+                        if reset_iso else "5-hour limit reached"
+                    ),
+                    error_step="pre_limit_check",
+                    limit_triggered=True,
+                    limit_reset_time=reset_iso
+                )
+        return None
+
+    def _paste_buffer_send(self, session_name: str, content: str, buffer_name: str) -> SendResult:
+        """将已加载的粘贴缓冲区粘贴到目标会话并回车（粘贴与回车为两步独立命令）"""
+        precheck_failure = self._run_pre_send_checks(session_name, content, SendMode.RAW)
+        if precheck_failure is not None:
+            return precheck_failure
+
+        paste_steps = (
+            ("paste", "content_paste", "Paste",
+             ['tmux', 'paste-buffer', '-p', '-b', buffer_name, '-t', session_name]),
+            ("enter", "enter_send", "Enter",
+             ['tmux', 'send-keys', '-t', session_name, 'C-m']),
+        )
+        steps_completed: List[str] = []
+        return_codes: List[int] = []
+        try:
+            for step, error_step, label, argv in paste_steps:
+                completed = subprocess.run(
+                    argv, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                    close_fds=_CLOSE_FDS
+                )
+                return_codes.append(completed.returncode)
+                if completed.returncode != 0:
+                    # 与其他发送路径一致：会话已不存在时使会话缓存失效
+                    self._invalidate_session_cache(completed.stderr)
+                    return self._paste_result(
+                        session_name, content, steps_completed, return_codes,
+                        f"{label} failed: {completed.stderr}", error_step
+                    )
+                steps_completed.append(step)
+        except Exception as e:
+            return self._paste_result(
+                session_name, content, steps_completed, return_codes,
+                f"Paste send exception: {str(e)}", "execution_exception"
+            )
+        return self._paste_result(session_name, content, steps_completed, return_codes)
 
-    def _send_text_input(self, session_name: str, text: str) -> SendResult:
-        """发送文本输入的核心实现"""
-        return self._execute_two_step_send(session_name, text, SendMode.TEXT)
+    @staticmethod
+    def _paste_result(session_name: str, content: str, steps_completed: List[str],
+                      return_codes: List[int], error: Optional[str] = None,
+                      error_step: Optional[str] = None) -> SendResult:
+        """构建粘贴发送结果（error 为空即成功；返回码依次对应粘贴与回车）"""
+        codes = return_codes + [None, None]
+        return SendResult(
+            success=error is None,
+            session_name=session_name,
+            content=content,
+            mode=SendMode.RAW,
+            steps_completed=steps_completed,
+            error=error,
+            error_step=error_step,
+            return_code_1=codes[0],
+            return_code_2=codes[1]
+        )
 
-    def _send_control_key(self, session_name: str, key: str) -> SendResult:
-        """发送控制键的核心实现"""
+    def _send_control_key(self, session_name: str, key: str,
+                          mode: SendMode = SendMode.CONTROL) -> SendResult:
+        """发送控制键的核心实现（mode 参数仅为与分发表签名一致）"""
         if self._dry_run:
             logger.info(f"🔄 DRY RUN - Control Key: {session_name} <- {key}")
             return SendResult(
@@ -236,40 +837,35 @@ class TmuxSendGateway:
             )
 
         try:
-            result = subprocess.run([
-                'tmux', 'send-keys', '-t', session_name, key
-            ], capture_output=True, text=True)
-
-            if result.returncode == 0:
+            outcome = self._run_control_commands([['send-keys', '-t', session_name, key]])
+            if outcome is None:
+                result = subprocess.run([
+                    'tmux', 'send-keys', '-t', session_name, key
+                ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, close_fds=_CLOSE_FDS)
+                outcome = (result.returncode, result.stderr)
+            returncode, stderr = outcome
+
+            if returncode != 0:
+                self._invalidate_session_cache(stderr)
+            if returncode == 0:
                 return SendResult(
                     success=True,
                     session_name=session_name,
                     content=key,
                     mode=SendMode.CONTROL,
                     steps_completed=["control_key"],
-                    return_code_1=result.returncode
+                    return_code_1=returncode
                 )
             else:
-                return SendResult(
-                    success=False,
-                    session_name=session_name,
-                    content=key,
-                    mode=SendMode.CONTROL,
-                    steps_completed=[],
-                    error=f"Control key send failed: {result.stderr}",
-                    error_step="control_execution",
-                    return_code_1=result.returncode
+                return self._fail(
+                    session_name, key, SendMode.CONTROL,
+                    f"Control key send failed: {stderr}", "control_execution", return_code_1=returncode
                 )
 
         except Exception as e:
-            return SendResult(
-                success=False,
-                session_name=session_name,
-                content=key,
-                mode=SendMode.CONTROL,
-                steps_completed=[],
-                error=f"Control key exception: {str(e)}",
-                error_step="control_exception"
+            return self._fail(
+                session_name, key, SendMode.CONTROL,
+                f"Control key exception: {str(e)}", "control_exception"
             )
 
     def _execute_two_step_send(self, session_name: str, content: str, mode: SendMode) -> SendResult:
@@ -288,108 +884,154 @@ class TmuxSendGateway:
                 steps_completed=["dry_run_content", "dry_run_enter"]
             )
 
-        steps_completed = []
-
         try:
-            # 🎯 第一步：发送内容（无引号包装）
-            step1_result = subprocess.run([
-                'tmux', 'send-keys', '-t', session_name, content
-            ], capture_output=True, text=True)
-
-            if step1_result.returncode != 0:
-                return SendResult(
-                    success=False,
-                    session_name=session_name,
-                    content=content,
-                    mode=mode,
-                    steps_completed=steps_completed,
-                    error=f"Step 1 failed: {step1_result.stderr}",
-                    error_step="content_send",
-                    return_code_1=step1_result.returncode
+            # 🎯 两步发送在同一次tmux调用中完成：内容（无引号包装） ; 回车（分离的send-keys命令）
+            # `--` 防止以 '-' 开头的内容被当作选项；结尾的 ';' 需转义，否则会被tmux当作命令分隔符
+            outcome = self._run_control_commands([
+                ['send-keys', '-t', session_name, '--', content],
+                ['send-keys', '-t', session_name, 'C-m']
+            ])
+            if outcome is None:
+                result = subprocess.run(
+                    self._two_step_argv(session_name, content),
+                    stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                    close_fds=_CLOSE_FDS
                 )
+                outcome = (result.returncode, result.stderr)
+            return self._two_step_result(session_name, content, mode, *outcome)
 
-            steps_completed.append("content")
-
-            # 🎯 第二步：发送回车键（分离操作）
-            step2_result = subprocess.run([
-                'tmux', 'send-keys', '-t', session_name, 'C-m'
-            ], capture_output=True, text=True)
+        except Exception as e:
+            return self._fail(
+                session_name, content, mode,
+                f"Two-step send exception: {str(e)}", "execution_exception"
+            )
 
-            if step2_result.returncode != 0:
-                return SendResult(
-                    success=False,
-                    session_name=session_name,
-                    content=content,
-                    mode=mode,
-                    steps_completed=steps_completed,
-                    error=f"Step 2 failed: {step2_result.stderr}",
-                    error_step="enter_send",
-                    return_code_1=step1_result.returncode,
-                    return_code_2=step2_result.returncode
-                )
+    # 发送模式 -> 实现方法（RAW/COMMAND/TEXT 均为两步发送，仅语义不同）
+    _DISPATCH = {
+        SendMode.RAW: _execute_two_step_send,
+        SendMode.COMMAND: _execute_two_step_send,
+        SendMode.TEXT: _execute_two_step_send,
+        SendMode.CONTROL: _send_control_key,
+    }
 
-            steps_completed.append("enter")
+    @staticmethod
+    def _two_step_argv(session_name: str, content: str) -> List[str]:
+        """两步发送的tmux命令行：内容（无引号包装） ; 回车（分离的send-keys命令）"""
+        return [
+            'tmux', 'send-keys', '-t', session_name, '--', _escape_trailing_semicolon(content),
+            ';', 'send-keys', '-t', session_name, 'C-m'
+        ]
 
-            # 成功完成两步发送
-            if self._debug_mode:
-                logger.debug(f"✅ Two-step send completed: {session_name}")
+    @staticmethod
+    def _fail(session_name: str, content: str, mode: SendMode, error: str,
+              error_step: str, **extra) -> SendResult:
+        """构建未完成任何步骤的失败结果（共享空步骤元组，不为每次失败分配列表）"""
+        return SendResult(
+            success=False,
+            session_name=session_name,
+            content=content,
+            mode=mode,
+            steps_completed=_EMPTY_STEPS,
+            error=error,
+            error_step=error_step,
+            **extra
+        )
 
-            return SendResult(
-                success=True,
-                session_name=session_name,
-                content=content,
-                mode=mode,
-                steps_completed=steps_completed,
-                return_code_1=step1_result.returncode,
-                return_code_2=step2_result.returncode
+    def _two_step_result(self, session_name: str, content: str, mode: SendMode,
+                         returncode: int, stderr: str) -> SendResult:
+        """根据两步发送的返回码构建发送结果"""
+        if returncode != 0:
+            self._invalidate_session_cache(stderr)
+            return self._fail(
+                session_name, content, mode,
+                f"Two-step send failed: {stderr}", "content_send", return_code_1=returncode
             )
 
-        except Exception as e:
-            return SendResult(
-                success=False,
-                session_name=session_name,
-                content=content,
-                mode=mode,
-                steps_completed=steps_completed,
-                error=f"Two-step send exception: {str(e)}",
-                error_step="execution_exception"
-            )
+        # 成功完成两步发送
+        if self._debug_mode:
+            logger.debug(f"✅ Two-step send completed: {session_name}")
 
-    def _validate_session(self, session_name: str) -> bool:
-        """验证会话是否存在"""
-        try:
-            result = subprocess.run([
-                'tmux', 'has-session', '-t', session_name
-            ], capture_output=True, text=True)
-            return result.returncode == 0
-        except Exception:
-            return False
+        return SendResult(
+            success=True,
+            session_name=session_name,
+            content=content,
+            mode=mode,
+            steps_completed=["content", "enter"],
+            return_code_1=returncode,
+            return_code_2=returncode
+        )
+
+    def _run_control_commands(self, commands: List[List[str]]) -> Optional[Tuple[int, str]]:
+        """经控制模式长连接执行命令；未启用或命令未能送达时返回None（调用方回退到子进程）
+
+        命令送达后响应丢失时返回非0返回码，调用方按发送失败处理。
+        """
+        if not self._control_mode:
+            return None
+        cls = type(self)
+        with cls._control_lock:
+            if cls._control_client is None:
+                cls._control_client = _ControlModeClient()
+            try:
+                return cls._control_client.run(commands)
+            except OSError as e:
+                logger.debug("控制模式执行失败，回退到子进程: %s", e)
+                return None
+
+    def session_exists(self, session_name: str) -> bool:
+        """验证会话是否存在（基于 list-sessions 的TTL缓存，替代逐次 has-session）"""
+        cls = type(self)
+        with cls._session_set_lock:
+            fresh = time.monotonic() - cls._sessions_cache_ts < cls._session_validate_ttl
+            if fresh and session_name in cls._session_set:
+                return True
+        return session_name in self.get_available_sessions()
+
+    def get_cached_sessions(self) -> frozenset:
+        """获取会话名集合（`_session_validate_ttl` 内复用上次的 list-sessions 结果）"""
+        cls = type(self)
+        with cls._session_set_lock:
+            if time.monotonic() - cls._sessions_cache_ts < cls._session_validate_ttl:
+                return cls._session_set
+        return frozenset(self.get_available_sessions())
+
+    @classmethod
+    def _invalidate_session_cache(cls, stderr: str) -> None:
+        """发送错误表明会话/服务器已不存在时，使会话缓存失效"""
+        if "can't find" in stderr or "no server" in stderr:
+            with cls._session_set_lock:
+                cls._sessions_cache_ts = 0.0
 
     # === 系统级别方法 ===
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def is_tmux_available() -> bool:
-        """检查tmux是否可用"""
-        try:
-            result = subprocess.run(['tmux', '-V'], capture_output=True, text=True)
-            return result.returncode == 0
-        except Exception:
-            return False
+        """检查tmux是否可用（进程内tmux可执行文件位置不变，结果缓存，无需fork `tmux -V`）"""
+        return shutil.which('tmux') is not None
 
     def get_available_sessions(self) -> List[str]:
-        """获取所有可用会话列表"""
+        """获取所有可用会话列表（总是执行 list-sessions，并刷新会话名缓存）"""
+        cls = type(self)
+        now = time.monotonic()
         try:
             result = subprocess.run([
                 'tmux', 'list-sessions', '-F', '#{session_name}'
-            ], capture_output=True, text=True)
+            ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
 
             if result.returncode == 0:
-                return [s.strip() for s in result.stdout.strip().split('\n') if s.strip()]
+                output = result.stdout.decode('utf-8', 'replace')
+                sessions = [s.strip() for s in output.split('\n') if s.strip()]
             else:
-                return []
+                sessions = []
         except Exception:
             return []
 
+        with cls._session_set_lock:
+            cls._session_set = frozenset(sessions)
+            cls._sessions_cache_ts = now
+        return sessions
+
     # === 速率限制检测（参考 examples/hooks/tmux_web_service.py） ===
 
     def _capture_pane(self, session_name: str) -> str:
@@ -468,8 +1110,11 @@ class TmuxSendGateway:
 
 # === 全局网关实例和便捷函数 ===
 
-# 创建全局唯一的网关实例
-_gateway = TmuxSendGateway()
+# 字符串模式 -> SendMode（便捷函数按字典查找，不走枚举构造与异常路径）
+_STR_TO_MODE = {m.value: m for m in SendMode}
+
+# 创建全局唯一的网关实例（直接使用模块级实例，不再经由单例 __new__）
+GATEWAY = TmuxSendGateway()
 
 def send_to_tmux(session_name: str, content: str, mode: str = "raw") -> SendResult:
     """
@@ -483,20 +1128,14 @@ def send_to_tmux(session_name: str, content: str, mode: str = "raw") -> SendResu
     Returns:
         SendResult: 发送结果
     """
-    try:
-        send_mode = SendMode(mode)
-    except ValueError:
-        return SendResult(
-            success=False,
-            session_name=session_name,
-            content=content,
-            mode=SendMode.RAW,
-            steps_completed=[],
-            error=f"Invalid send mode: {mode}",
-            error_step="mode_validation"
+    send_mode = _STR_TO_MODE.get(mode)
+    if send_mode is None:
+        return TmuxSendGateway._fail(
+            session_name, content, SendMode.RAW,
+            f"Invalid send mode: {mode}", "mode_validation"
         )
 
-    return _gateway.send(session_name, content, send_mode)
+    return GATEWAY.send(session_name, content, send_mode)
 
 def broadcast_to_tmux(session_names: List[str], content: str, mode: str = "raw") -> Dict[str, Any]:
     """
@@ -510,16 +1149,13 @@ def broadcast_to_tmux(session_names: List[str], content: str, mode: str = "raw")
     Returns:
         Dict[str, Any]: 广播结果
     """
-    try:
-        send_mode = SendMode(mode)
-    except ValueError:
-        send_mode = SendMode.RAW
+    send_mode = _STR_TO_MODE.get(mode, SendMode.RAW)
 
-    return _gateway.broadcast_to_sessions(session_names, content, send_mode)
+    return GATEWAY.broadcast_to_sessions(session_names, content, send_mode)
 
 def get_tmux_gateway() -> TmuxSendGateway:
     """获取全局网关实例"""
-    return _gateway
+    return GATEWAY
 
 # === 便捷类型检查函数 ===
 
@@ -530,3 +1166,7 @@ def enable_debug_mode(enabled: bool = True):
 def enable_dry_run_mode(enabled: bool = True):
     """启用全局干跑模式"""
     TmuxSendGateway.enable_dry_run(enabled)
+
+def enable_control_mode(enabled: bool = True):
+    """启用全局控制模式长连接"""
+    TmuxSendGateway.enable_control_mode(enabled)
@@ -6,37 +6,108 @@ Web Port Client - 主会话 Web 服务交互工具（内部）
 - post_health(port, payload) → 上报 /message/health
 
 说明：不启动或引用任何 examples/ 下的实现，调用方只关心端口是否就绪、能否发送。
+每个端口复用一条 keep-alive 连接，避免周期性健康上报反复握手。
 """
 
 from __future__ import annotations
 
 from typing import Dict, Any
-import urllib.request
+import http.client
 import json
+import threading
 
+try:  # 可选加速：orjson 直接输出 bytes，省去一次 encode
+    import orjson
+except ImportError:
+    orjson = None
 
-def _base_url(port: int) -> str:
-    return f"http://127.0.0.1:{port}"
+# 端口 -> 复用的 keep-alive 连接；HTTPConnection 非线程安全，整个请求周期持有该端口的锁
+_connections: Dict[int, http.client.HTTPConnection] = {}
+# 每个端口一把锁：某个端口响应缓慢时不阻塞对其他端口的请求
+_port_locks: Dict[int, threading.Lock] = {}
+_port_locks_guard = threading.Lock()
+
+# 表明复用连接在收到响应前就已失效的错误（服务端已关闭空闲连接），仅这些情况重试；
+# 超时等其他错误不重试，避免重复投递与等待时间翻倍
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+def _port_lock(port: int) -> threading.Lock:
+    """获取（按需创建）指定端口的连接锁"""
+    lock = _port_locks.get(port)
+    if lock is None:
+        with _port_locks_guard:
+            lock = _port_locks.setdefault(port, threading.Lock())
+    return lock
+
+
+def _exchange(port: int, conn: http.client.HTTPConnection, method: str, path: str,
+              body: bytes, headers: Dict[str, str]) -> int:
+    """在给定连接上完成一次请求/响应；失败或服务端要求关闭时移除该连接"""
+    try:
+        conn.request(method, path, body=body, headers=headers or {})
+        resp = conn.getresponse()
+        resp.read()
+    except (http.client.HTTPException, OSError):
+        conn.close()
+        _connections.pop(port, None)
+        raise
+    if resp.will_close:
+        conn.close()
+        _connections.pop(port, None)
+    return resp.status
+
+
+def _request(port: int, method: str, path: str, timeout: float,
+             body: bytes = None, headers: Dict[str, str] = None) -> int:
+    """经复用连接发送请求并返回状态码（≤50行）
+
+    复用的连接可能已被服务端关闭：仅当错误表明连接在响应开始前已失效时，
+    丢弃连接并用新连接重试一次；超时不重试。
+    """
+    with _port_lock(port):
+        conn = _connections.get(port)
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            try:
+                return _exchange(port, conn, method, path, body, headers)
+            except _STALE_CONNECTION_ERRORS:
+                pass
+
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=timeout)
+        _connections[port] = conn
+        return _exchange(port, conn, method, path, body, headers)
+
+
+def _encode_payload(payload: Dict[str, Any]) -> bytes:
+    """序列化上报负载为 JSON bytes（优先使用 orjson）"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
 
 
 def check_service(port: int, timeout: float = 2.0) -> bool:
     """检查 Web 服务 /health 可达（≤50行）"""
-    url = _base_url(port) + "/health"
     try:
-        with urllib.request.urlopen(url, timeout=timeout) as resp:
-            return resp.status == 200
+        return _request(port, "GET", "/health", timeout) == 200
     except Exception:
         return False
 
 
 def post_health(port: int, payload: Dict[str, Any], timeout: float = 2.0) -> bool:
     """POST 到 /message/health（≤50行）"""
-    url = _base_url(port) + "/message/health"
-    data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    data = _encode_payload(payload)
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return resp.status == 200
+        status = _request(
+            port, "POST", "/message/health", timeout,
+            body=data, headers={"Content-Type": "application/json"}
+        )
+        return status == 200
     except Exception:
         return False
-
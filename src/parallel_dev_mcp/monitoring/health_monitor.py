@@ -4,18 +4,21 @@ Health Monitor - 基础系统健康监控
 移除了过度设计的诊断、性能指标等复杂功能。
 """
 
-import json
+import copy
+import functools
 import subprocess
-from datetime import datetime, timedelta
-from typing import Dict, Any, List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Dict, Any, List, Set
 import psutil
-import os
 
 # 复用已重构的组件
 from .._internal.global_registry import get_global_registry
 from .._internal.health_store import get_health_store
-from ..server import _get_env_var
-from .._internal.health_utils import calculate_session_health_score
+from .._internal.config_tools import get_env_var
+from .._internal.health_utils import assess_system_health_level, calculate_session_info_health_score
 
 # MCP工具装饰器
 def mcp_tool(name: str = None, description: str = None):
@@ -29,13 +32,41 @@ def mcp_tool(name: str = None, description: str = None):
 # 全局共享会话注册中心
 _session_registry = get_global_registry()
 
+# 健康检查共享线程池：各子检查（CPU采样、tmux子进程、注册表遍历）互不依赖，可并行等待。
+# 超时的子检查无法中断，会继续占用线程；留出一倍余量，避免下一次报告排队在其后
+_HEALTH_MAX_WORKERS = 8
+_health_executor = None
+_health_executor_lock = threading.Lock()
+
+
+# 全部子检查共用的等待时限（秒）：超时或异常只影响该组件，不拖垮整份报告
+_HEALTH_CHECK_TIMEOUT = 5.0
+
+# 健康报告短TTL缓存：轮询场景下合并重复调用，按参数组合分别缓存 (生成时刻, 报告)
+_HEALTH_CACHE_TTL = 2.0
+_health_cache: Dict[tuple, tuple] = {}
+
+
+def _get_health_executor() -> ThreadPoolExecutor:
+    """按需创建健康检查共享线程池（整个进程复用）"""
+    global _health_executor
+    if _health_executor is None:
+        with _health_executor_lock:
+            if _health_executor is None:
+                _health_executor = ThreadPoolExecutor(
+                    max_workers=_HEALTH_MAX_WORKERS, thread_name_prefix="health-check"
+                )
+    return _health_executor
+
+
 @mcp_tool(
     name="check_system_health",
     description="全面的系统健康检查，包括会话状态、系统资源、tmux状态"
 )
 def check_system_health(
     include_detailed_metrics: bool = False,
-    check_tmux_integrity: bool = True
+    check_tmux_integrity: bool = True,
+    use_cache: bool = True
 ) -> Dict[str, Any]:
     """
     系统健康检查 - 全面的系统状态评估
@@ -43,47 +74,94 @@ def check_system_health(
     Args:
         include_detailed_metrics: 是否包含详细的系统指标
         check_tmux_integrity: 是否检查tmux完整性
+        use_cache: 为False时忽略缓存强制重新检查（结果仍会刷新缓存）
+
+    同一参数组合在 `_HEALTH_CACHE_TTL` 秒内的重复调用返回上次报告的深拷贝，
+    调用方修改返回值不会影响其他调用方。
     """
+    cache_key = (include_detailed_metrics, check_tmux_integrity)
+    if use_cache:
+        cached_report = _get_cached_health_report(cache_key)
+        if cached_report is not None:
+            return cached_report
+
     try:
+        # 整个报告共用同一时刻：报告时间戳、心跳快照与会话活跃度评估
+        now = datetime.now()
         health_report = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "overall_status": "unknown",
             "health_score": 0.0,
-            "components": {}
+            "components": _run_health_checks(now, include_detailed_metrics, check_tmux_integrity)
         }
-        
-        # 1. 检查会话健康状况
-        session_health = _check_sessions_health()
-        health_report["components"]["sessions"] = session_health
-        
-        # 2. 检查系统资源
-        system_health = _check_system_resources(include_detailed_metrics)
-        health_report["components"]["system_resources"] = system_health
-        
-        # 3. 检查tmux状态
-        if check_tmux_integrity:
-            tmux_health = _check_tmux_integrity()
-            health_report["components"]["tmux"] = tmux_health
-        
-        # 4. 检查MCP组件状态
-        mcp_health = _check_mcp_components()
-        health_report["components"]["mcp_components"] = mcp_health
-        
         # 5. 计算总体健康分数
         health_report["health_score"] = _calculate_overall_health_score(health_report["components"])
         health_report["overall_status"] = _determine_health_status(health_report["health_score"])
-        
         # 6. 生成建议
         health_report["recommendations"] = _generate_health_recommendations(health_report)
-        
-    return health_report
-        
+
+        _store_health_report(cache_key, health_report)
+        return health_report
     except Exception as e:
         return {
             "success": False,
             "error": f"系统健康检查失败: {str(e)}"
         }
 
+
+def _get_cached_health_report(cache_key: tuple):
+    """返回 `_HEALTH_CACHE_TTL` 内缓存报告的深拷贝；无缓存或已过期返回None"""
+    cached = _health_cache.get(cache_key)
+    if cached is None or time.monotonic() - cached[0] >= _HEALTH_CACHE_TTL:
+        return None
+    return copy.deepcopy(cached[1])
+
+
+def _store_health_report(cache_key: tuple, health_report: Dict[str, Any]) -> None:
+    """缓存报告的独立副本；含超时/失败组件的报告不缓存，下次调用重新检查"""
+    if any(component.get("status") == "error"
+           for component in health_report["components"].values()):
+        return
+    # 本次调用方修改返回的报告不会污染缓存
+    _health_cache[cache_key] = (time.monotonic(), copy.deepcopy(health_report))
+
+
+def _run_health_checks(now: datetime, include_detailed_metrics: bool,
+                       check_tmux_integrity: bool) -> Dict[str, Any]:
+    """在共享线程池中并行执行各子检查，所有检查共用同一截止时间
+
+    Returns:
+        组件名 -> 检查结果；超时或异常的组件为 error 状态
+    """
+    # 注册表只遍历一次，会话健康与tmux一致性检查共用同一快照
+    all_sessions = _session_registry.list_all_sessions()
+
+    # 1-4. 会话健康、系统资源、tmux状态、MCP组件 —— 互不依赖，并行执行
+    checks = {
+        "sessions": lambda: _check_sessions_health(now, all_sessions),
+        "system_resources": lambda: _check_system_resources(include_detailed_metrics),
+    }
+    if check_tmux_integrity:
+        checks["tmux"] = lambda: _check_tmux_integrity(set(all_sessions))
+    checks["mcp_components"] = _check_mcp_components
+
+    executor = _get_health_executor()
+    futures = {name: executor.submit(check) for name, check in checks.items()}
+    # 所有子检查共用同一截止时间，而不是逐个等待（最坏情况下时限叠加）
+    wait(futures.values(), timeout=_HEALTH_CHECK_TIMEOUT)
+    return {name: _collect_check_result(name, future) for name, future in futures.items()}
+
+def _collect_check_result(name: str, future) -> Dict[str, Any]:
+    """读取已到截止时间的子检查结果；未完成或异常时返回该组件的 error 状态"""
+    if not future.done():
+        # 仍在排队的检查直接取消；已在运行的无法中断，结果被丢弃
+        future.cancel()
+        return {"status": "error", "error": f"{name} 检查超时（>{_HEALTH_CHECK_TIMEOUT}s）"}
+    try:
+        return future.result()
+    except Exception as e:
+        return {"status": "error", "error": f"{name} 检查失败: {str(e)}"}
+
 # 过度设计的工具已移除：
 # - diagnose_session_issues: 过度复杂的会话诊断分析
 # - get_performance_metrics: 过度复杂的性能指标收集
@@ -91,38 +169,29 @@ def check_system_health(
 
 # === 内部辅助函数 ===
 
-def _check_sessions_health() -> Dict[str, Any]:
+def _check_sessions_health(now: datetime = None,
+                           all_sessions: Dict[str, Any] = None) -> Dict[str, Any]:
     """检查所有会话的健康状况（≤50行）"""
-    all_sessions = _session_registry.list_all_sessions()
+    now = now or datetime.now()
+    if all_sessions is None:
+        all_sessions = _session_registry.list_all_sessions()
     hs = get_health_store()
     # 从 env 读取阈值（默认 5/15/45 秒）
     def _to_int(name, default):
-        v = _get_env_var(name)
+        v = get_env_var(name)
         return int(v) if v and str(v).isdigit() else default
     interval = _to_int('HEALTH_INTERVAL', 5)
     degraded_s = _to_int('HEALTH_DEGRADED', 15)
     dead_s = _to_int('HEALTH_DEAD', 45)
-    snap = hs.snapshot(interval_sec=interval, degraded_sec=degraded_s, dead_sec=dead_s)
+    snap = hs.snapshot(now, interval_sec=interval, degraded_sec=degraded_s, dead_sec=dead_s)
     
-    healthy_count = 0
     total_sessions = len(all_sessions)
-    session_details = {}
-    
-    for name, session_info in all_sessions.items():
-        session_dict = session_info.to_dict()
-        health_score = calculate_session_health_score(session_dict)
-        # 合并心跳状态（若存在）
-        hb = snap["sessions"].get(name)
-        status = hb["status"] if hb else ("healthy" if health_score > 0.8 else "warning" if health_score > 0.5 else "unhealthy")
-        session_details[name] = {
-            "health_score": health_score,
-            "status": status,
-            "last_activity": session_dict.get("last_activity"),
-            "message_count": session_dict.get("message_count", 0)
-        }
-        
-        if status == "healthy":
-            healthy_count += 1
+    heartbeats = snap["sessions"]
+    session_details = {
+        name: _session_detail(session_info, heartbeats.get(name), now)
+        for name, session_info in all_sessions.items()
+    }
+    healthy_count = sum(1 for detail in session_details.values() if detail["status"] == "healthy")
     
     return {
         "status": "healthy" if healthy_count == total_sessions else "degraded",
@@ -133,37 +202,107 @@ def _check_sessions_health() -> Dict[str, Any]:
         "heartbeat_snapshot": snap
     }
 
+def _session_detail(session_info: Any, hb: Dict[str, Any] = None,
+                    now: datetime = None) -> Dict[str, Any]:
+    """构建单个会话的健康详情（心跳状态优先，否则按健康分数判定）"""
+    # 直接读取 SessionInfo 属性，不经 to_dict() 构建中间字典
+    health_score = calculate_session_info_health_score(session_info, now)
+    return {
+        "health_score": health_score,
+        "status": hb["status"] if hb else _score_status(health_score),
+        "last_activity": session_info.last_activity.isoformat(),
+        "message_count": session_info.message_count
+    }
+
+def _score_status(health_score: float) -> str:
+    """无心跳数据时，按健康分数阈值判定会话状态"""
+    if health_score > 0.8:
+        return "healthy"
+    if health_score > 0.5:
+        return "warning"
+    return "unhealthy"
+
+
+# CPU采样状态：首次调用需短暂阻塞预热，之后使用非阻塞增量采样
+_CPU_SAMPLE_MIN_INTERVAL = 1.0
+_last_cpu_sample = {"ts": 0.0, "value": 0.0}
+_cpu_sample_lock = threading.Lock()
+
+
+def _sample_cpu_percent(min_interval: float = _CPU_SAMPLE_MIN_INTERVAL) -> float:
+    """获取CPU使用率，不再每次阻塞1秒
+
+    psutil.cpu_percent(interval=None) 返回自上次调用以来的平均使用率；
+    仅进程内首次调用以0.1秒间隔采样一次作为基准。距上次采样不足
+    `min_interval` 秒时直接复用上次结果（过短窗口的增量噪声大）。
+    """
+    with _cpu_sample_lock:
+        now = time.monotonic()
+        if _last_cpu_sample["ts"] == 0.0:
+            value = psutil.cpu_percent(interval=0.1)
+        elif now - _last_cpu_sample["ts"] < min_interval:
+            return _last_cpu_sample["value"]
+        else:
+            value = psutil.cpu_percent(interval=None)
+        _last_cpu_sample["ts"] = time.monotonic()
+        _last_cpu_sample["value"] = value
+        return value
+
+
+# 磁盘使用率变化缓慢：statvfs 结果按TTL缓存
+_DISK_USAGE_TTL = 30.0
+_disk_cache = {"ts": 0.0, "value": None}
+
+
+def _get_disk_usage():
+    """获取根分区使用情况（`_DISK_USAGE_TTL` 秒内复用上次结果）"""
+    now = time.monotonic()
+    if _disk_cache["value"] is None or now - _disk_cache["ts"] > _DISK_USAGE_TTL:
+        _disk_cache["value"] = psutil.disk_usage('/')
+        _disk_cache["ts"] = now
+    return _disk_cache["value"]
+
+
+@functools.lru_cache(maxsize=1)
+def _cpu_count() -> int:
+    """逻辑CPU数量（进程生命周期内不变，缓存结果）"""
+    return psutil.cpu_count()
+
+
+# 资源告警阈值：(告警文案, 百分比上限)，顺序对应 CPU/内存/磁盘 读数
+_RESOURCE_THRESHOLDS = (
+    ("CPU使用率过高", 80),
+    ("内存使用率过高", 85),
+    ("磁盘使用率过高", 90),
+)
+
+
 def _check_system_resources(include_detailed: bool = False) -> Dict[str, Any]:
     """检查系统资源使用情况"""
     try:
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = _sample_cpu_percent()
         memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        disk = _get_disk_usage()
+        
+        # 检查资源警告（健康路径下不格式化任何字符串）
+        readings = (cpu_percent, memory.percent, disk.percent)
+        warnings = [
+            f"{label}: {value}%"
+            for (label, threshold), value in zip(_RESOURCE_THRESHOLDS, readings)
+            if value > threshold
+        ]
         
         resource_status = {
-            "status": "healthy",
+            "status": "warning" if warnings else "healthy",
             "cpu_usage": cpu_percent,
             "memory_usage": memory.percent,
             "disk_usage": disk.percent,
-            "warnings": []
+            "warnings": warnings
         }
         
-        # 检查资源警告
-        if cpu_percent > 80:
-            resource_status["warnings"].append(f"CPU使用率过高: {cpu_percent}%")
-            resource_status["status"] = "warning"
-        
-        if memory.percent > 85:
-            resource_status["warnings"].append(f"内存使用率过高: {memory.percent}%")
-            resource_status["status"] = "warning"
-        
-        if disk.percent > 90:
-            resource_status["warnings"].append(f"磁盘使用率过高: {disk.percent}%")
-            resource_status["status"] = "warning"
-        
         if include_detailed:
             resource_status["detailed_info"] = {
-                "cpu_count": psutil.cpu_count(),
+                "cpu_count": _cpu_count(),
                 "memory_total_gb": round(memory.total / (1024**3), 2),
                 "memory_available_gb": round(memory.available / (1024**3), 2),
                 "disk_total_gb": round(disk.total / (1024**3), 2),
@@ -178,30 +317,45 @@ def _check_system_resources(include_detailed: bool = False) -> Dict[str, Any]:
             "error": f"无法获取系统资源信息: {str(e)}"
         }
 
+def _probe_tmux_once() -> Dict[str, Any]:
+    """执行一次 list-sessions，得到本次健康检查共用的tmux状态
+
+    Returns:
+        Dict[str, Any]: {"available": tmux服务是否可用, "sessions": 会话名称集合}
+    """
+    # -F 只输出会话名，无需再按 ':' 切分默认格式
+    # 只需要stdout：stderr直接丢弃，输出按字节读取后一次性解码
+    result = subprocess.run(['tmux', 'list-sessions', '-F', '#{session_name}'],
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=2)
+    if result.returncode != 0:
+        return {"available": False, "sessions": set()}
+
+    session_names = set(result.stdout.decode('utf-8', 'replace').splitlines())
+    session_names.discard('')
+    return {"available": True, "sessions": session_names}
+
+
 def _check_tmux_availability() -> Dict[str, Any]:
     """检查tmux服务可用性
     
     Returns:
-        Dict[str, Any]: tmux可用性状态
+        Dict[str, Any]: tmux可用性状态（可用时附带 tmux_session_names）
     """
     try:
-        result = subprocess.run(['tmux', 'list-sessions'], 
-                              capture_output=True, text=True)
+        probe = _probe_tmux_once()
         
         tmux_status = {
             "status": "healthy",
-            "tmux_available": result.returncode == 0,
+            "tmux_available": probe["available"],
             "issues": []
         }
         
-        if result.returncode != 0:
+        if not probe["available"]:
             tmux_status["status"] = "error"
             tmux_status["issues"].append("tmux服务不可用")
             return tmux_status
         
-        # 获取tmux会话列表
-        tmux_sessions = result.stdout.strip().split('\n') if result.stdout.strip() else []
-        tmux_status["tmux_sessions"] = tmux_sessions
+        tmux_status["tmux_session_names"] = probe["sessions"]
         
         return tmux_status
         
@@ -212,23 +366,19 @@ def _check_tmux_availability() -> Dict[str, Any]:
         }
 
 
-def _check_session_consistency(tmux_sessions: List[str]) -> Dict[str, Any]:
+def _check_session_consistency(tmux_session_names: Set[str],
+                               registered_sessions: Set[str] = None) -> Dict[str, Any]:
     """检查会话一致性
     
     Args:
-        tmux_sessions: tmux会话列表
+        tmux_session_names: tmux会话名称集合（来自 _probe_tmux_once）
+        registered_sessions: 已注册会话名称集合（未提供时读取注册中心）
         
     Returns:
         Dict[str, Any]: 会话一致性检查结果
     """
-    registered_sessions = set(_session_registry.list_all_sessions().keys())
-    
-    # 解析tmux会话名称
-    tmux_session_names = set()
-    for line in tmux_sessions:
-        if ':' in line:
-            session_name = line.split(':')[0]
-            tmux_session_names.add(session_name)
+    if registered_sessions is None:
+        registered_sessions = set(_session_registry.list_all_sessions())
     
     # 查找不一致的会话
     orphaned_tmux = tmux_session_names - registered_sessions
@@ -253,8 +403,12 @@ def _check_session_consistency(tmux_sessions: List[str]) -> Dict[str, Any]:
     return consistency_status
 
 
-def _check_tmux_integrity() -> Dict[str, Any]:
-    """检查tmux完整性"""
+def _check_tmux_integrity(registered_names: Set[str] = None) -> Dict[str, Any]:
+    """检查tmux完整性
+
+    Args:
+        registered_names: 已注册会话名称集合（由 check_system_health 传入共享快照）
+    """
     try:
         # 1. 检查tmux可用性
         availability_result = _check_tmux_availability()
@@ -262,7 +416,9 @@ def _check_tmux_integrity() -> Dict[str, Any]:
             return availability_result
         
         # 2. 检查会话一致性
-        consistency_result = _check_session_consistency(availability_result["tmux_sessions"])
+        consistency_result = _check_session_consistency(
+            availability_result["tmux_session_names"], registered_names
+        )
         
         # 合并结果
         final_status = {
@@ -288,7 +444,7 @@ def _check_mcp_components() -> Dict[str, Any]:
         "status": "healthy",
         "components": {
             "session_registry": {"status": "healthy", "active_sessions": len(_session_registry.active_sessions)},
-            "message_system": {"status": "healthy", "total_messages": sum(len(msgs) for msgs in _session_registry.session_messages.values())},
+            "message_system": {"status": "healthy", "total_messages": _session_registry.total_messages},
             "relationship_system": {"status": "healthy", "total_relationships": len(_session_registry.session_relationships)}
         }
     }
@@ -321,18 +477,9 @@ def _calculate_overall_health_score(components: Dict[str, Any]) -> float:
     
     return sum(scores) / len(scores) if scores else 0.0
 
-def _determine_health_status(score: float) -> Dict[str, Any]:
-    """根据分数确定健康状态"""
-    if score >= 0.9:
-        return "excellent"
-    elif score >= 0.7:
-        return "good"
-    elif score >= 0.5:
-        return "fair"
-    elif score >= 0.3:
-        return "poor"
-    else:
-        return "critical"
+def _determine_health_status(score: float) -> str:
+    """根据分数确定健康状态（与 health_utils 的分级阈值一致）"""
+    return assess_system_health_level(score)
 
 def _generate_health_recommendations(health_report: Dict[str, Any]) -> List[str]:
     """生成健康建议"""
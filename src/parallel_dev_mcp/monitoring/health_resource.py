@@ -6,13 +6,40 @@ Health Resource - 会话健康只读资源（监控层）
 
 from __future__ import annotations
 
+import time
 from datetime import datetime
 from typing import Dict, Any
 
 from fastmcp import FastMCP  # type: ignore
 from .._internal.health_store import get_health_store
 from .._internal.global_registry import get_global_registry
-from ..server import _get_env_var, mcp
+from .._internal.config_tools import get_env_var
+from ..server import mcp
+
+# 只缓存由环境变量解析出的阈值（每个心跳间隔重新读取一次）；
+# 会话基础信息与心跳状态每次调用都从注册表/HealthStore 重建，避免会话增删与消息数滞后
+_thresholds_cache: Dict[str, Any] = {"ts": 0.0, "value": None}
+
+
+def _env_int(name: str, default: int) -> int:
+    """读取整数环境变量，缺失或非法时返回默认值"""
+    v = get_env_var(name)
+    return int(v) if v and str(v).isdigit() else default
+
+
+def _get_thresholds() -> Dict[str, int]:
+    """获取健康阈值（按心跳间隔缓存）"""
+    now = time.monotonic()
+    cached = _thresholds_cache["value"]
+    if cached is None or now - _thresholds_cache["ts"] >= cached["interval_sec"]:
+        cached = {
+            "interval_sec": _env_int("HEALTH_INTERVAL", 5),
+            "degraded_sec": _env_int("HEALTH_DEGRADED", 15),
+            "dead_sec": _env_int("HEALTH_DEAD", 45),
+        }
+        _thresholds_cache["value"] = cached
+        _thresholds_cache["ts"] = now
+    return cached
 
 
 @mcp.resource("monitoring://sessions")
@@ -20,35 +47,19 @@ def health_sessions_resource() -> Dict[str, Any]:
     """返回全量会话健康快照（≤50行）"""
     reg = get_global_registry()
     hs = get_health_store()
+    thresholds = _get_thresholds()
 
-    def _to_int(name: str, default: int) -> int:
-        v = _get_env_var(name)
-        return int(v) if v and str(v).isdigit() else default
-
-    snap = hs.snapshot(
-        interval_sec=_to_int("HEALTH_INTERVAL", 5),
-        degraded_sec=_to_int("HEALTH_DEGRADED", 15),
-        dead_sec=_to_int("HEALTH_DEAD", 45),
-    )
-    sessions = reg.list_all_sessions()
-    out: Dict[str, Any] = {
+    snap = hs.snapshot(**thresholds)
+    unknown = {
+        "status": "unknown",
+        "age_sec": None,
+        "expected_interval_sec": thresholds["interval_sec"],
+    }
+    return {
         "generated_at": datetime.now().isoformat(),
-        "thresholds": {
-            "interval_sec": _to_int("HEALTH_INTERVAL", 5),
-            "degraded_sec": _to_int("HEALTH_DEGRADED", 15),
-            "dead_sec": _to_int("HEALTH_DEAD", 45),
+        "thresholds": dict(thresholds),
+        "sessions": {
+            name: {**info.to_dict(), "health": snap["sessions"].get(name) or dict(unknown)}
+            for name, info in reg.list_all_sessions().items()
         },
-        "sessions": {},
     }
-    for name, info in sessions.items():
-        base = info.to_dict()
-        hb = snap["sessions"].get(name, {})
-        out["sessions"][name] = {
-            **base,
-            "health": hb or {
-                "status": "unknown",
-                "age_sec": None,
-                "expected_interval_sec": _to_int("HEALTH_INTERVAL", 5),
-            },
-        }
-    return out
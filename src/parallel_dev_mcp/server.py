@@ -30,40 +30,12 @@ MCP_CONFIG = os.environ.get('MCP_CONFIG') or os.environ.get('MCP_CONFIG_PATH')
 HOOKS_MCP_CONFIG = os.environ.get('HOOKS_MCP_CONFIG')
 PROJECT_ROOT = os.environ.get('PROJECT_ROOT', os.getcwd())
 
-def _get_env_var(name: str, default: str | None = None) -> str | None:
-    """从 mcp.json 的 env 或 loaded_config 中读取变量，不再依赖 shell export。
-    优先级：loaded_config.env -> loaded_config.environment.env/variables -> loaded_config.mcpServers.*.env -> os.environ
-    """
-    try:
-        cfg = get_loaded_config()
-        if isinstance(cfg, dict):
-            # 顶层 env
-            env = cfg.get('env')
-            if isinstance(env, dict) and name in env:
-                return str(env[name])
-            # environment 下的 env/variables
-            environment = cfg.get('environment')
-            if isinstance(environment, dict):
-                env2 = environment.get('env') or environment.get('variables')
-                if isinstance(env2, dict) and name in env2:
-                    return str(env2[name])
-            # mcpServers.*.env
-            ms = cfg.get('mcpServers')
-            if isinstance(ms, dict):
-                for srv in ms.values():
-                    if isinstance(srv, dict):
-                        env3 = srv.get('env')
-                        if isinstance(env3, dict) and name in env3:
-                            return str(env3[name])
-        # 回退环境变量
-        return os.environ.get(name, default)
-    except Exception:
-        return os.environ.get(name, default)
 HOOKS_CONFIG_DIR = os.environ.get('HOOKS_CONFIG_DIR', os.path.join(PROJECT_ROOT, 'config/hooks'))
 DANGEROUSLY_SKIP_PERMISSIONS = os.environ.get('DANGEROUSLY_SKIP_PERMISSIONS', 'false').lower() == 'true'
 
 # 导入配置管理工具
 from ._internal.config_tools import set_loaded_config, get_loaded_config
+from ._internal.config_tools import get_env_var as _get_env_var
 from ._internal import SessionNaming
 from ._internal.health_store import get_health_store
 from ._internal.web_port import check_service, post_health
@@ -161,7 +133,8 @@ def _resolve_master_target(current_session: str | None) -> tuple[str | None, str
 def _tmux_session_exists(name: str) -> bool:
     """判断 tmux 会话是否存在。"""
     try:
-        subprocess.run(['tmux', 'has-session', '-t', name], check=True, capture_output=True)
+        subprocess.run(['tmux', 'has-session', '-t', name], check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         return True
     except subprocess.CalledProcessError:
         return False
@@ -18,7 +18,6 @@ from .._internal import SessionNaming
 import threading
 from datetime import datetime
 import os
-from ..session.prompts import master_message, child_message
 
 # MCP工具装饰器
 def mcp_tool(name: str = None, description: str = None):
@@ -416,7 +415,7 @@ def broadcast_tmux_message(
                     "total_sessions": result.get("total_sessions", 0),
                     "success_count": result.get("success_count", 0),
                     "failed_count": result.get("failed_count", 0),
-                    "success_rate": result.get("success_rate", "0%")
+                    "success_rate": result.get("success_rate", 0.0)
                 },
                 "target_sessions": result.get("target_sessions", []),
                 "failed_sessions": result.get("failed_sessions", []),
@@ -508,6 +507,8 @@ def send_tmux_message_prompted(
     message_type: str = "direct"
 ) -> Dict[str, Any]:
     """根据会话类型选择主/子模板，插入 {task}（可选），再发送。"""
+    # 局部导入避免循环（prompts 依赖 server 中先创建的 mcp 实例）
+    from .prompts import master_message, child_message
     try:
         s_type = SessionNaming.get_session_type(session_name)
         msgs = master_message(task=task, substitute=substitute) if s_type == "master" else child_message(task=task, substitute=substitute)
@@ -231,8 +231,6 @@ def launch_claude_in_session(
         continue_session: 是否继续会话（默认False）
     """
     try:
-        import os
-
         # 从环境变量获取配置参数（如果未提供）
         if mcp_config_path is None:
             mcp_config_path = os.environ.get('MCP_CONFIG_PATH')
@@ -6,13 +6,14 @@ Simple Tmux Session Manager - 纯会话管理
 """
 
 import json
+import shutil
 import time
 from pathlib import Path
 from typing import Dict, Any, List
 from datetime import datetime
 
 from .tmux_operations import TmuxOperations
-from .._internal import SessionNaming
+from .._internal import SessionNaming, TmuxExecutor
 
 
 class TmuxSessionManager:
@@ -87,16 +88,12 @@ class TmuxSessionManager:
             all_sessions = self.tmux.list_sessions()
             project_sessions = self._filter_project_sessions(all_sessions)
             
-            healthy_sessions = 0
-            session_details = {}
-            
-            for session in project_sessions:
-                session_name = session['name']
-                health_info = self._check_session_health(session_name)
-                session_details[session_name] = health_info
-                
-                if health_info.get("healthy", False):
-                    healthy_sessions += 1
+            session_details = self._verify_sessions_health(
+                [session['name'] for session in project_sessions]
+            )
+            healthy_sessions = sum(
+                1 for health_info in session_details.values() if health_info.get("healthy", False)
+            )
             
             return {
                 "success": True,
@@ -170,7 +167,6 @@ class TmuxSessionManager:
             # 清理消息目录
             message_dir = self.project_dir / "messages"
             if message_dir.exists():
-                import shutil
                 shutil.rmtree(message_dir)
                 message_dir.mkdir(exist_ok=True)
             
@@ -229,21 +225,22 @@ class TmuxSessionManager:
                 errors.append(f"无法创建子会话: {child_session}")
     
     def _verify_sessions_health(self, session_names: List[str]) -> Dict[str, Any]:
-        """验证会话健康状态"""
-        health_status = {}
-        for session_name in session_names:
-            health_status[session_name] = self._check_session_health(session_name)
-        return health_status
-    
-    def _check_session_health(self, session_name: str) -> Dict[str, Any]:
-        """检查单个会话健康状态"""
+        """验证会话健康状态（一次list-sessions批量检查）"""
         try:
-            if self.tmux.session_exists(session_name):
-                return {"healthy": True, "session_name": session_name}
-            else:
-                return {"healthy": False, "reason": "会话不存在"}
+            existence = TmuxExecutor.session_exists_many(session_names)
         except Exception as e:
-            return {"healthy": False, "reason": str(e)}
+            return {name: {"healthy": False, "reason": str(e)} for name in session_names}
+        return {
+            name: self._session_health_entry(name, exists)
+            for name, exists in existence.items()
+        }
+    
+    @staticmethod
+    def _session_health_entry(session_name: str, exists: bool) -> Dict[str, Any]:
+        """构建单个会话的健康状态条目"""
+        if exists:
+            return {"healthy": True, "session_name": session_name}
+        return {"healthy": False, "reason": "会话不存在"}
     
     def _filter_project_sessions(self, all_sessions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """过滤项目相关会话"""
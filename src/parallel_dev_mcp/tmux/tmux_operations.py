@@ -16,7 +16,7 @@ class TmuxOperations:
     def is_available() -> bool:
         """检查tmux是否可用"""
         try:
-            result = subprocess.run(['tmux', '-V'], capture_output=True, text=True)
+            result = subprocess.run(['tmux', '-V'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return result.returncode == 0
         except Exception:
             return False
@@ -84,7 +84,7 @@ class TmuxOperations:
             # 检查会话是否存在
             result = subprocess.run(
                 ['tmux', 'has-session', '-t', session_name],
-                capture_output=True, text=True
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
             )
             
             if result.returncode != 0:
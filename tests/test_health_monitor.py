@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""健康监控测试
+
+验证包可被直接导入（无循环导入），以及 health_monitor 的子检查收集、
+采样缓存与报告缓存逻辑。
+"""
+
+import importlib
+import os
+import sys
+import threading
+import unittest
+from concurrent.futures import Future
+from unittest import mock
+
+# 以仓库根目录为导入根，按 `src.parallel_dev_mcp` 包路径导入（与 AGENTS.md 中的运行方式一致）
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.parallel_dev_mcp._internal.session_registry import SessionRegistry
+from src.parallel_dev_mcp.monitoring import health_monitor, health_resource
+
+
+class TestPackageImport(unittest.TestCase):
+    """包导入测试类"""
+
+    def test_import_server(self):
+        """服务器模块可直接导入"""
+        server = importlib.import_module("src.parallel_dev_mcp.server")
+        self.assertTrue(hasattr(server, "mcp"))
+        self.assertTrue(callable(server._get_env_var))
+
+    def test_import_health_monitor(self):
+        """健康监控模块可直接导入"""
+        module = importlib.import_module("src.parallel_dev_mcp.monitoring.health_monitor")
+        self.assertTrue(callable(module.check_system_health))
+
+    def test_import_mcp_tools(self):
+        """聚合导出模块可直接导入"""
+        importlib.import_module("src.mcp_tools")
+
+
+class TestCollectCheckResult(unittest.TestCase):
+    """子检查结果收集测试类"""
+
+    def test_completed_check(self):
+        """已完成的检查直接返回结果"""
+        future = Future()
+        future.set_result({"status": "healthy"})
+        self.assertEqual(health_monitor._collect_check_result("tmux", future), {"status": "healthy"})
+
+    def test_failed_check(self):
+        """检查抛出异常时返回该组件的 error 状态"""
+        future = Future()
+        future.set_exception(RuntimeError("boom"))
+        result = health_monitor._collect_check_result("tmux", future)
+        self.assertEqual(result["status"], "error")
+        self.assertIn("boom", result["error"])
+
+    def test_unfinished_check_is_cancelled(self):
+        """截止时仍未完成的检查被取消并记为超时"""
+        future = Future()
+        result = health_monitor._collect_check_result("tmux", future)
+        self.assertEqual(result["status"], "error")
+        self.assertIn("超时", result["error"])
+        self.assertTrue(future.cancelled())
+
+
+class TestResourceSampling(unittest.TestCase):
+    """资源采样缓存测试类"""
+
+    def setUp(self):
+        for cache, initial in ((health_monitor._last_cpu_sample, 0.0),
+                               (health_monitor._disk_cache, None)):
+            patcher = mock.patch.dict(cache, {"ts": 0.0, "value": initial})
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_cpu_sample_reused_within_interval(self):
+        """首次阻塞采样作为基准，最小间隔内复用上次结果"""
+        with mock.patch.object(health_monitor.psutil, "cpu_percent",
+                               side_effect=[12.0, 34.0]) as cpu_percent:
+            self.assertEqual(health_monitor._sample_cpu_percent(), 12.0)
+            self.assertEqual(health_monitor._sample_cpu_percent(), 12.0)
+            self.assertEqual(health_monitor._sample_cpu_percent(min_interval=0.0), 34.0)
+
+        self.assertEqual(cpu_percent.call_args_list,
+                         [mock.call(interval=0.1), mock.call(interval=None)])
+
+    def test_disk_usage_cached(self):
+        """TTL内只执行一次 disk_usage"""
+        with mock.patch.object(health_monitor.psutil, "disk_usage",
+                               return_value="usage") as disk_usage:
+            self.assertEqual(health_monitor._get_disk_usage(), "usage")
+            self.assertEqual(health_monitor._get_disk_usage(), "usage")
+
+        disk_usage.assert_called_once_with('/')
+
+
+class TestSessionsHealth(unittest.TestCase):
+    """会话健康检查测试类"""
+
+    def test_registry_snapshot(self):
+        """基于传入的注册表快照统计会话状态"""
+        registry = SessionRegistry()
+        registry.register_session("parallel_P_task_master", "master")
+        registry.register_session("parallel_P_task_child_A", "child")
+        registry.add_message_to_session("parallel_P_task_child_A", {"id": "1"})
+
+        result = health_monitor._check_sessions_health(all_sessions=registry.list_all_sessions())
+
+        self.assertEqual(result["total_sessions"], 2)
+        self.assertEqual(
+            result["session_details"]["parallel_P_task_child_A"]["message_count"], 1
+        )
+
+
+class TestCheckSystemHealth(unittest.TestCase):
+    """系统健康报告测试类"""
+
+    def setUp(self):
+        self.calls = 0
+        self.tmux_status = {"status": "healthy"}
+        patches = [
+            mock.patch.dict(health_monitor._health_cache, clear=True),
+            mock.patch.object(health_monitor, "_check_sessions_health",
+                              side_effect=self._count({"status": "healthy", "total_sessions": 0})),
+            mock.patch.object(health_monitor, "_check_system_resources",
+                              return_value={"status": "healthy"}),
+            mock.patch.object(health_monitor, "_check_tmux_integrity",
+                              side_effect=lambda names: self.tmux_status),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _count(self, result):
+        def check(*args, **kwargs):
+            self.calls += 1
+            return result
+        return check
+
+    def test_report_cached_within_ttl(self):
+        """同一参数组合在TTL内复用上次报告"""
+        first = health_monitor.check_system_health()
+        second = health_monitor.check_system_health()
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(set(first["components"]),
+                         {"sessions", "system_resources", "tmux", "mcp_components"})
+
+    def test_cached_report_is_a_copy(self):
+        """修改返回的报告不影响缓存与其他调用方"""
+        first = health_monitor.check_system_health()
+        first["components"].pop("tmux")
+        first["extra"] = True
+        second = health_monitor.check_system_health()
+
+        self.assertEqual(self.calls, 1)
+        self.assertIsNot(first, second)
+        self.assertIn("tmux", second["components"])
+        self.assertNotIn("extra", second)
+        self.assertIsNot(second, health_monitor.check_system_health())
+
+    def test_use_cache_false_forces_refresh(self):
+        """use_cache=False 时重新执行全部检查"""
+        health_monitor.check_system_health()
+        health_monitor.check_system_health(use_cache=False)
+
+        self.assertEqual(self.calls, 2)
+
+    def test_failed_report_not_cached(self):
+        """含 error 组件的报告不缓存"""
+        self.tmux_status = {"status": "error", "error": "tmux 检查失败"}
+
+        health_monitor.check_system_health()
+        health_monitor.check_system_health()
+
+        self.assertEqual(self.calls, 2)
+
+    def test_hung_check_bounded_by_deadline(self):
+        """挂起的子检查在截止时间后记为超时，不阻塞整份报告"""
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def hang(names):
+            release.wait(5)
+            return {"status": "healthy"}
+
+        with mock.patch.object(health_monitor, "_check_tmux_integrity", side_effect=hang), \
+                mock.patch.object(health_monitor, "_HEALTH_CHECK_TIMEOUT", 0.2):
+            report = health_monitor.check_system_health()
+
+        self.assertEqual(report["components"]["tmux"]["status"], "error")
+        self.assertEqual(report["components"]["sessions"]["status"], "healthy")
+
+
+class TestHealthSessionsResource(unittest.TestCase):
+    """会话健康资源测试类"""
+
+    def setUp(self):
+        self.registry = SessionRegistry()
+        patcher = mock.patch.object(health_resource, "get_global_registry",
+                                    return_value=self.registry)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_sessions_not_stale(self):
+        """连续调用时新注册会话与消息数立即可见"""
+        self.registry.register_session("parallel_P_task_master", "master")
+        first = health_resource.health_sessions_resource()
+
+        self.registry.register_session("parallel_P_task_child_A", "child")
+        self.registry.add_message_to_session("parallel_P_task_master", {"id": "1"})
+        second = health_resource.health_sessions_resource()
+
+        self.assertEqual(set(first["sessions"]), {"parallel_P_task_master"})
+        self.assertEqual(set(second["sessions"]),
+                         {"parallel_P_task_master", "parallel_P_task_child_A"})
+        self.assertEqual(second["sessions"]["parallel_P_task_master"]["message_count"], 1)
+        self.assertEqual(second["sessions"]["parallel_P_task_child_A"]["health"]["status"],
+                         "unknown")
+
+
+if __name__ == '__main__':
+    unittest.main()
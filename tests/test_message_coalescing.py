@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""TmuxMessageSender 合并发送队列单元测试
+
+验证 enqueue_message_raw 的同会话合并、取消语义与工作线程的健壮性。
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+# 直接导入 _internal 包（包顶层 __init__ 会加载整个MCP服务器）
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'parallel_dev_mcp'))
+
+from _internal.tmux_message_sender import TmuxMessageSender
+
+
+class TestMessageCoalescing(unittest.TestCase):
+    """合并发送队列测试类"""
+
+    def setUp(self):
+        """放宽合并窗口，便于在首条消息发出前完成操作"""
+        self.sent = []
+        window = mock.patch.object(TmuxMessageSender, '_coalesce_window_seconds', 0.2)
+        send = mock.patch.object(
+            TmuxMessageSender, 'send_message_raw',
+            side_effect=lambda session, message, session_id=None:
+                self.sent.append((session, message)) or {"success": True}
+        )
+        window.start()
+        send.start()
+        self.addCleanup(window.stop)
+        self.addCleanup(send.stop)
+
+    def test_same_session_messages_are_merged(self):
+        """连续发往同一会话的消息合并为一次发送"""
+        futures = [TmuxMessageSender.enqueue_message_raw("s1", f"line{i}") for i in range(3)]
+        results = [future.result(timeout=5) for future in futures]
+
+        self.assertEqual(self.sent, [("s1", "line0\nline1\nline2")])
+        for result in results:
+            self.assertTrue(result["success"])
+            self.assertEqual(result["coalesced_messages"], 3)
+
+    def test_different_sessions_are_not_merged(self):
+        """目标会话变化时分别发送"""
+        first = TmuxMessageSender.enqueue_message_raw("s1", "a")
+        second = TmuxMessageSender.enqueue_message_raw("s2", "b")
+        first.result(timeout=5)
+        second.result(timeout=5)
+
+        self.assertEqual(self.sent, [("s1", "a"), ("s2", "b")])
+
+    def test_cancelled_message_is_dropped_and_worker_survives(self):
+        """已取消的消息不发送，且后续排队消息仍能正常完成"""
+        cancelled = TmuxMessageSender.enqueue_message_raw("s1", "cancelled")
+        self.assertTrue(cancelled.cancel())
+        kept = TmuxMessageSender.enqueue_message_raw("s1", "kept")
+
+        self.assertEqual(kept.result(timeout=5)["coalesced_messages"], 1)
+        later = TmuxMessageSender.enqueue_message_raw("s1", "later")
+        self.assertTrue(later.result(timeout=5)["success"])
+
+        self.assertEqual(self.sent, [("s1", "kept"), ("s1", "later")])
+
+    def test_all_cancelled_batch_sends_nothing(self):
+        """整批取消时不发起发送"""
+        future = TmuxMessageSender.enqueue_message_raw("s1", "gone")
+        future.cancel()
+        after = TmuxMessageSender.enqueue_message_raw("s2", "after")
+        after.result(timeout=5)
+
+        self.assertEqual(self.sent, [("s2", "after")])
+
+
+if __name__ == "__main__":
+    unittest.main()
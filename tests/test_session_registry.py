@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""SessionRegistry 单元测试
+
+验证增量维护的 total_messages 与各会话消息列表保持一致。
+"""
+
+import os
+import sys
+import unittest
+
+# 直接导入 _internal 包（包顶层 __init__ 会加载整个MCP服务器）
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'parallel_dev_mcp'))
+
+from _internal.session_registry import SessionRegistry
+
+
+class TestTotalMessages(unittest.TestCase):
+    """消息总数统计测试类"""
+
+    def setUp(self):
+        self.registry = SessionRegistry()
+
+    def assertTotalConsistent(self):
+        """total_messages 等于各会话消息列表长度之和"""
+        expected = sum(len(messages) for messages in self.registry.session_messages.values())
+        self.assertEqual(self.registry.total_messages, expected)
+        self.assertEqual(self.registry.get_registry_stats()["total_messages"], expected)
+
+    def test_add_messages(self):
+        """添加消息（含未注册会话）时递增"""
+        self.registry.register_session("s1")
+        self.registry.add_message_to_session("s1", {"id": "1"})
+        self.registry.add_message_to_session("s1", {"id": "2"})
+        self.registry.add_message_to_session("unregistered", {"id": "3"})
+
+        self.assertEqual(self.registry.total_messages, 3)
+        self.assertTotalConsistent()
+
+    def test_remove_session_subtracts_its_messages(self):
+        """移除会话时扣除其消息数"""
+        self.registry.register_session("s1")
+        self.registry.register_session("s2")
+        self.registry.add_message_to_session("s1", {"id": "1"})
+        self.registry.add_message_to_session("s2", {"id": "2"})
+
+        self.registry.remove_session("s1")
+        self.registry.remove_session("s1")
+
+        self.assertEqual(self.registry.total_messages, 1)
+        self.assertTotalConsistent()
+
+    def test_register_resets_leftover_messages(self):
+        """注册会话时清空其遗留消息并扣除计数"""
+        self.registry.add_message_to_session("s1", {"id": "1"})
+        self.registry.add_message_to_session("s1", {"id": "2"})
+
+        self.assertTrue(self.registry.register_session("s1"))
+        self.assertFalse(self.registry.register_session("s1"))
+
+        self.assertEqual(self.registry.total_messages, 0)
+        self.assertTotalConsistent()
+
+    def test_cleanup_inactive_sessions(self):
+        """清理非活跃会话后计数保持一致"""
+        self.registry.register_session("old")
+        self.registry.register_session("new")
+        self.registry.add_message_to_session("old", {"id": "1"})
+        self.registry.add_message_to_session("new", {"id": "2"})
+        self.registry.active_sessions["old"].last_activity = \
+            self.registry.active_sessions["old"].last_activity.replace(year=2000)
+
+        self.registry.cleanup_inactive_sessions(max_inactive_hours=1)
+
+        self.assertNotIn("old", self.registry.active_sessions)
+        self.assertTotalConsistent()
+
+
+if __name__ == '__main__':
+    unittest.main()
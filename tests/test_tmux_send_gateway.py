@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""TmuxSendGateway 与 TmuxExecutor 测试
+
+纯单元测试覆盖 tmux 命令语法的引用/转义与控制模式输出块解析；
+依赖 tmux 的测试在独立的 tmux 服务器（临时 TMUX_TMPDIR）中创建会话，
+会话内运行 `cat > 文件`，以文件内容核对实际送达的按键。
+"""
+
+import asyncio
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+# 直接导入 _internal 包（包顶层 __init__ 会加载整个MCP服务器）
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'parallel_dev_mcp'))
+
+from _internal import tmux_send_gateway
+from _internal.tmux_executor import TmuxExecutor
+from _internal.tmux_send_gateway import (
+    SendMode,
+    TmuxSendGateway,
+    _ControlModeClient,
+    _escape_trailing_semicolon,
+    _tmux_quote,
+    get_tmux_gateway,
+)
+
+
+class _FakeControlProcess:
+    """以管道模拟 tmux -C 客户端：stdout 输出预置内容，stdin 写入即丢弃"""
+
+    def __init__(self, output: bytes):
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, output)
+        os.close(write_fd)
+        self.stdout = os.fdopen(read_fd, 'rb', buffering=0)
+        self.stdin = open(os.devnull, 'wb', buffering=0)
+
+    def poll(self):
+        return None
+
+    def wait(self, timeout=None):
+        return 0
+
+    def kill(self):
+        pass
+
+
+class TestTmuxQuoting(unittest.TestCase):
+    """tmux 命令语法引用与转义测试类"""
+
+    def test_plain_argument_is_single_quoted(self):
+        """普通参数放入单引号"""
+        self.assertEqual(_tmux_quote("send-keys"), "'send-keys'")
+        self.assertEqual(_tmux_quote("a b;$HOME"), "'a b;$HOME'")
+
+    def test_empty_argument(self):
+        """空参数引用为空字符串字面量"""
+        self.assertEqual(_tmux_quote(""), "''")
+
+    def test_single_quote_and_newlines(self):
+        """单引号与换行拆出单引号，以双引号形式拼接"""
+        self.assertEqual(_tmux_quote("it's"), "'it'\"'\"'s'")
+        self.assertEqual(_tmux_quote("a\nb"), "'a'\"\\n\"'b'")
+        self.assertEqual(_tmux_quote("\r"), "\"\\r\"")
+        self.assertEqual(_tmux_quote("'"), "\"'\"")
+
+    def test_escape_trailing_semicolon(self):
+        """仅转义结尾的 ';'"""
+        self.assertEqual(_escape_trailing_semicolon("ls;"), "ls\\;")
+        self.assertEqual(_escape_trailing_semicolon(";"), "\\;")
+        self.assertEqual(_escape_trailing_semicolon("a;b"), "a;b")
+        self.assertEqual(_escape_trailing_semicolon(""), "")
+
+
+class TestSendManyCommands(unittest.TestCase):
+    """批量发送命令构建测试类"""
+
+    def test_each_item_is_sent_in_two_steps(self):
+        """每条内容与回车为两条独立的 send-keys 命令"""
+        self.assertEqual(
+            TmuxSendGateway._send_many_commands("s1", ["a", "b"], SendMode.RAW),
+            [['send-keys', '-t', 's1', '--', 'a'], ['send-keys', '-t', 's1', 'C-m'],
+             ['send-keys', '-t', 's1', '--', 'b'], ['send-keys', '-t', 's1', 'C-m']]
+        )
+
+    def test_control_keys_have_no_enter(self):
+        """CONTROL 模式每条一个控制键，不追加回车"""
+        self.assertEqual(
+            TmuxSendGateway._send_many_commands("s1", ["C-c", "C-l"], SendMode.CONTROL),
+            [['send-keys', '-t', 's1', 'C-c'], ['send-keys', '-t', 's1', 'C-l']]
+        )
+
+
+class TestChainedFailureSplit(unittest.TestCase):
+    """串联广播失败定位测试类"""
+
+    def test_failed_session_in_the_middle(self):
+        """失败会话之前的条目成功，其后的条目（除同名条目外）重新串联"""
+        names = ["a", "ghost", "b", "ghost", "c"]
+        self.assertEqual(
+            TmuxSendGateway._split_chained_failure(names, [0, 1, 2, 3, 4],
+                                                   "can't find session: ghost\n"),
+            ([0], [1, 3], [2, 4])
+        )
+
+    def test_unknown_error_fails_all_remaining(self):
+        """无法定位失败会话时剩余目标全部失败，不重发"""
+        self.assertEqual(
+            TmuxSendGateway._split_chained_failure(["a", "b"], [0, 1], "server exited"),
+            ([], [0, 1], [])
+        )
+
+
+class TestControlModeParsing(unittest.TestCase):
+    """控制模式 %begin/%end 输出块解析测试类"""
+
+    def _client(self, output: bytes) -> _ControlModeClient:
+        client = _ControlModeClient(timeout=1.0)
+        client._proc = proc = _FakeControlProcess(output)
+        self.addCleanup(proc.stdout.close)
+        self.addCleanup(proc.stdin.close)
+        return client
+
+    def test_success_blocks(self):
+        """全部以 %end 结束时返回码为0"""
+        client = self._client(b"%begin 1 10 1\n%end 1 10 1\n%begin 1 11 1\n%end 1 11 1\n")
+        self.assertEqual(client._read_results(2), (0, ""))
+
+    def test_error_block_collects_body(self):
+        """%error 块的内容作为错误输出返回"""
+        client = self._client(
+            b"%begin 1 10 1\n%end 1 10 1\n"
+            b"%begin 1 11 1\ncan't find session: ghost\n%error 1 11 1\n"
+        )
+        self.assertEqual(client._read_results(2), (1, "can't find session: ghost"))
+
+    def test_foreign_blocks_and_notifications_are_ignored(self):
+        """标志位不为1的输出块与通知行不计入结果"""
+        client = self._client(
+            b"%sessions-changed\n"
+            b"%begin 1 9 0\nother client\n%error 1 9 0\n"
+            b"%begin 1 10 1\n%end 1 10 1\n"
+        )
+        self.assertEqual(client._read_results(1), (0, ""))
+
+    def test_closed_connection_raises_oserror(self):
+        """输出提前结束时 _read_results 以 OSError 报告（由 run 转为失败结果）"""
+        client = self._client(b"%begin 1 10 1\n")
+        with self.assertRaises(OSError):
+            client._read_results(1)
+
+    def test_lost_response_after_write_is_a_failure(self):
+        """命令写入后响应丢失时返回失败而不抛出（调用方不得回退重发）"""
+        client = self._client(b"%begin 1 10 1\n")
+
+        returncode, stderr = client.run([['send-keys', '-t', 's1', 'x']])
+
+        self.assertEqual(returncode, -1)
+        self.assertIn("response lost", stderr)
+        self.assertIsNone(client._proc)
+
+    def test_write_failure_raises_oserror(self):
+        """命令写入失败时抛出 OSError（命令未送达，调用方可回退）"""
+        client = self._client(b"")
+        client._proc.stdin.close()
+
+        with self.assertRaises(OSError):
+            client.run([['send-keys', '-t', 's1', 'x']])
+
+
+@unittest.skipUnless(shutil.which('tmux'), "需要tmux")
+class TmuxServerTestCase(unittest.TestCase):
+    """在独立tmux服务器中运行的测试基类"""
+
+    # 占位会话：服务器在整个测试类期间保持运行。kill-server 不等待服务器退出，
+    # 每个测试重启服务器会与下一次 new-session 竞争
+    _KEEPALIVE_SESSION = "gateway_test_keepalive"
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmpdir = tempfile.mkdtemp(prefix="gateway-test-")
+        cls._env = mock.patch.dict(os.environ, {"TMUX_TMPDIR": cls._tmpdir})
+        cls._env.start()
+        os.environ.pop("TMUX", None)
+        subprocess.run(['tmux', 'new-session', '-d', '-s', cls._KEEPALIVE_SESSION, 'cat'], check=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        subprocess.run(['tmux', 'kill-server'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        cls._env.stop()
+        shutil.rmtree(cls._tmpdir, ignore_errors=True)
+
+    def setUp(self):
+        self.gateway = get_tmux_gateway()
+        TmuxSendGateway._sessions_cache_ts = 0.0
+        # 以清理函数关闭会话：在子类注册的清理（如关闭控制模式）之后执行
+        self.addCleanup(self.kill_test_sessions)
+
+    def kill_test_sessions(self):
+        """关闭本测试创建的会话（保留占位会话）"""
+        listed = subprocess.run(['tmux', 'list-sessions', '-F', '#{session_name}'],
+                                capture_output=True, text=True).stdout.split()
+        for name in listed:
+            if name != self._KEEPALIVE_SESSION:
+                subprocess.run(['tmux', 'kill-session', '-t', name])
+        TmuxSendGateway._sessions_cache_ts = 0.0
+
+    def new_session(self, name: str) -> str:
+        """创建运行 `cat > 文件` 的会话，返回接收输入的文件路径"""
+        output = os.path.join(self._tmpdir, f"{name}.out")
+        open(output, 'w').close()
+        subprocess.run(['tmux', 'new-session', '-d', '-s', name, f"cat > {output}"], check=True)
+        return output
+
+    @staticmethod
+    def read_lines(path: str, count: int, timeout: float = 5.0):
+        """等待文件中出现 count 行后返回全部行（稍等片刻以暴露多余的投递）"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with open(path) as f:
+                if f.read().count("\n") >= count:
+                    break
+            time.sleep(0.02)
+        time.sleep(0.1)
+        with open(path) as f:
+            return f.read().splitlines()
+
+
+class TestSessionExistsMany(TmuxServerTestCase):
+    """TmuxExecutor 批量会话检查测试类"""
+
+    def test_existing_and_missing_sessions(self):
+        """一次 list-sessions 判断全部会话"""
+        self.new_session("alpha")
+        self.new_session("beta")
+
+        self.assertEqual(
+            TmuxExecutor.session_exists_many(["alpha", "ghost", "beta"]),
+            {"alpha": True, "ghost": False, "beta": True}
+        )
+
+    def test_no_server(self):
+        """tmux服务器未运行时全部视为不存在"""
+        with tempfile.TemporaryDirectory() as empty_dir, \
+                mock.patch.dict(os.environ, {"TMUX_TMPDIR": empty_dir}):
+            self.assertEqual(TmuxExecutor.session_exists_many(["alpha"]), {"alpha": False})
+
+
+class TestGatewaySend(TmuxServerTestCase):
+    """网关发送路径测试类"""
+
+    def test_send_many_in_order(self):
+        """批量发送按顺序送达，结尾的 ';' 原样保留"""
+        output = self.new_session("alpha")
+
+        result = self.gateway.send_many("alpha", ["one", "two;", "-three"])
+
+        self.assertTrue(result.success, result.error)
+        self.assertEqual(self.read_lines(output, 3), ["one", "two;", "-three"])
+
+    def test_send_many_chunks(self):
+        """超过分块大小时拆分为多次tmux调用"""
+        output = self.new_session("alpha")
+        contents = [f"line{i}" for i in range(5)]
+
+        with mock.patch.object(tmux_send_gateway, '_SEND_MANY_CHUNK_SIZE', 2):
+            result = self.gateway.send_many("alpha", contents)
+
+        self.assertTrue(result.success, result.error)
+        self.assertEqual(len(result.steps_completed), 10)
+        self.assertEqual(self.read_lines(output, 5), contents)
+
+    def test_send_lines(self):
+        """按换行拆分后逐行发送"""
+        output = self.new_session("alpha")
+
+        result = self.gateway.send_lines("alpha", "first\nsecond")
+
+        self.assertTrue(result.success, result.error)
+        self.assertEqual(self.read_lines(output, 2), ["first", "second"])
+
+    def test_send_many_missing_session(self):
+        """会话不存在时不执行发送"""
+        result = self.gateway.send_many("ghost", ["x"])
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.error_step, "session_validation")
+
+    def test_send_async_and_broadcast_async(self):
+        """异步发送与异步广播"""
+        alpha = self.new_session("alpha")
+        beta = self.new_session("beta")
+
+        async def run():
+            single = await self.gateway.send_async("alpha", "solo")
+            summary = await self.gateway.broadcast_async(["alpha", "beta", "ghost"], "all")
+            return single, summary
+
+        single, summary = asyncio.run(run())
+
+        self.assertTrue(single.success, single.error)
+        self.assertEqual(summary["success_count"], 2)
+        self.assertEqual(summary["failed_sessions"], ["ghost"])
+        self.assertEqual(self.read_lines(alpha, 2), ["solo", "all"])
+        self.assertEqual(self.read_lines(beta, 1), ["all"])
+
+    def test_broadcast_via_paste_buffer(self):
+        """粘贴缓冲区广播送达全部会话，且不残留缓冲区"""
+        alpha = self.new_session("alpha")
+        beta = self.new_session("beta")
+
+        summary = self.gateway.broadcast_via_paste_buffer(["alpha", "beta"], "pasted 'text';")
+
+        self.assertEqual(summary["success_count"], 2)
+        self.assertEqual(self.read_lines(alpha, 1), ["pasted 'text';"])
+        self.assertEqual(self.read_lines(beta, 1), ["pasted 'text';"])
+        buffers = subprocess.run(['tmux', 'list-buffers'], capture_output=True, text=True).stdout
+        self.assertNotIn("parallel_dev_broadcast", buffers)
+
+
+    def test_paste_failure_invalidates_session_cache(self):
+        """粘贴到已消失的会话失败时，使会话缓存失效"""
+        self.new_session("alpha")
+        self.assertTrue(self.gateway.session_exists("alpha"))
+        subprocess.run(['tmux', 'kill-session', '-t', 'alpha'], check=True)
+        self.assertTrue(self.gateway._load_paste_buffer("test_buffer", "x"))
+        self.addCleanup(self.gateway._delete_paste_buffer, "test_buffer")
+
+        result = self.gateway._paste_buffer_send("alpha", "x", "test_buffer")
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.error_step, "content_paste")
+        self.assertFalse(self.gateway.session_exists("alpha"))
+
+
+class TestChainedBroadcast(TmuxServerTestCase):
+    """串联广播失败定位测试类"""
+
+    def test_failure_in_the_middle_is_attributed(self):
+        """中间会话失败时仅该会话记为失败，其后的会话重新发送"""
+        alpha = self.new_session("alpha")
+        beta = self.new_session("beta")
+        listed = self.gateway.get_available_sessions
+        # 会话在校验之后消失：校验通过，但tmux执行时找不到
+        with mock.patch.object(self.gateway, 'get_available_sessions',
+                               side_effect=lambda: listed() + ["ghost"]):
+            results = self.gateway._chained_broadcast(["alpha", "ghost", "beta"], "msg", SendMode.RAW)
+
+        self.assertEqual([r.success for r in results], [True, False, True])
+        self.assertIn("ghost", results[1].error)
+        self.assertEqual(self.read_lines(alpha, 1), ["msg"])
+        self.assertEqual(self.read_lines(beta, 1), ["msg"])
+
+    def test_duplicate_entries_are_sent_per_entry(self):
+        """重复的会话名按条目投递并计数"""
+        alpha = self.new_session("alpha")
+        self.new_session("beta")
+
+        summary = self.gateway.broadcast_to_sessions(["alpha", "alpha", "beta"], "dup")
+
+        self.assertEqual(summary["total_sessions"], 3)
+        self.assertEqual(summary["success_count"], 3)
+        self.assertEqual(self.read_lines(alpha, 2), ["dup", "dup"])
+
+
+class TestControlMode(TmuxServerTestCase):
+    """控制模式长连接测试类"""
+
+    def setUp(self):
+        super().setUp()
+        TmuxSendGateway.enable_control_mode(True)
+        self.addCleanup(TmuxSendGateway.enable_control_mode, False)
+
+    def test_send_via_control_client(self):
+        """控制模式下经由长连接发送，特殊字符原样送达"""
+        output = self.new_session("alpha")
+
+        first = self.gateway.send_raw("alpha", "it's $HOME;")
+        second = self.gateway.send_many("alpha", ["a", "b"])
+
+        self.assertTrue(first.success, first.error)
+        self.assertTrue(second.success, second.error)
+        self.assertIsNotNone(TmuxSendGateway._control_client)
+        self.assertEqual(self.read_lines(output, 3), ["it's $HOME;", "a", "b"])
+
+    def test_control_client_reports_errors(self):
+        """命令失败时返回非0返回码与错误输出"""
+        self.new_session("alpha")
+        client = _ControlModeClient()
+        self.addCleanup(client.close)
+
+        self.assertEqual(client.run([['display-message', '-p', 'ok']]), (0, ""))
+        returncode, stderr = client.run([['send-keys', '-t', 'ghost', 'x']])
+        self.assertEqual(returncode, 1)
+        self.assertIn("ghost", stderr)
+
+    def test_lost_response_is_not_resent(self):
+        """命令送达后响应丢失时记为失败，不经子进程重发"""
+        output = self.new_session("alpha")
+        self.assertTrue(self.gateway.send_raw("alpha", "warmup").success)
+        client = TmuxSendGateway._control_client
+
+        with mock.patch.object(client, '_read_results', side_effect=OSError("response timeout")):
+            result = self.gateway.send_raw("alpha", "once")
+
+        self.assertFalse(result.success)
+        self.assertEqual(self.read_lines(output, 2), ["warmup", "once"])
+        self.assertTrue(self.gateway.send_raw("alpha", "after").success)
+        self.assertEqual(self.read_lines(output, 3), ["warmup", "once", "after"])
+
+    def test_falls_back_to_subprocess(self):
+        """长连接失败时回退到一次性子进程"""
+        output = self.new_session("alpha")
+
+        with mock.patch.object(_ControlModeClient, 'run', side_effect=OSError("boom")):
+            result = self.gateway.send_raw("alpha", "fallback")
+
+        self.assertTrue(result.success, result.error)
+        self.assertEqual(self.read_lines(output, 1), ["fallback"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Web Port 客户端单元测试
+
+验证 keep-alive 连接复用、失效连接重试与超时不重试的行为。
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 直接导入 _internal 包（包顶层 __init__ 会加载整个MCP服务器）
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'parallel_dev_mcp'))
+
+from _internal import web_port
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """记录请求次数；delay 控制响应前的等待时间，drop_idle 模拟服务端静默关闭空闲连接"""
+    protocol_version = "HTTP/1.1"
+    delay = 0.0
+    drop_idle = False
+    requests = 0
+
+    def do_POST(self):
+        type(self).requests += 1
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(type(self).delay)
+        self._reply()
+
+    def do_GET(self):
+        type(self).requests += 1
+        self._reply()
+
+    def _reply(self):
+        try:
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+            self.close_connection = type(self).drop_idle
+        except OSError:
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+class TestWebPort(unittest.TestCase):
+    """Web Port 客户端测试类"""
+
+    def setUp(self):
+        """启动本地HTTP服务"""
+        self.handler = type("Handler", (_Handler,), {"delay": 0.0, "drop_idle": False, "requests": 0})
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self.handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self._shutdown)
+
+    def _shutdown(self):
+        conn = web_port._connections.pop(self.port, None)
+        if conn is not None:
+            conn.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connection_is_reused(self):
+        """连续请求复用同一连接"""
+        self.assertTrue(web_port.check_service(self.port))
+        conn = web_port._connections[self.port]
+        self.assertTrue(web_port.post_health(self.port, {"status": "ok"}))
+        self.assertIs(web_port._connections[self.port], conn)
+        self.assertEqual(self.handler.requests, 2)
+
+    def test_stale_connection_is_retried_once(self):
+        """服务端关闭空闲连接后，请求换新连接重试成功"""
+        self.handler.drop_idle = True
+        self.assertTrue(web_port.check_service(self.port))
+        time.sleep(0.1)
+        self.assertTrue(web_port.post_health(self.port, {"status": "ok"}))
+        self.assertEqual(self.handler.requests, 2)
+
+    def test_timeout_is_not_retried(self):
+        """超时不重试：只投递一次，耗时不超过一个超时周期"""
+        self.assertTrue(web_port.check_service(self.port))
+        self.handler.delay = 1.5
+        start = time.monotonic()
+        self.assertFalse(web_port.post_health(self.port, {"status": "ok"}, timeout=0.5))
+        elapsed = time.monotonic() - start
+
+        time.sleep(1.2)
+        self.assertEqual(self.handler.requests, 2)
+        self.assertLess(elapsed, 1.0)
+
+    def test_slow_port_does_not_block_other_ports(self):
+        """某端口响应缓慢时，其他端口的请求不被阻塞"""
+        other = ThreadingHTTPServer(("127.0.0.1", 0), type("Fast", (_Handler,), {"requests": 0}))
+        other.daemon_threads = True
+        other_port = other.server_address[1]
+        threading.Thread(target=other.serve_forever, daemon=True).start()
+        self.addCleanup(other.server_close)
+        self.addCleanup(other.shutdown)
+        self.addCleanup(lambda: web_port._connections.pop(other_port, None))
+
+        self.handler.delay = 1.0
+        slow = threading.Thread(target=web_port.post_health, args=(self.port, {}), kwargs={"timeout": 3.0})
+        slow.start()
+        time.sleep(0.2)
+        start = time.monotonic()
+        self.assertTrue(web_port.post_health(other_port, {}))
+        self.assertLess(time.monotonic() - start, 0.5)
+        slow.join()
+
+
+if __name__ == "__main__":
+    unittest.main()